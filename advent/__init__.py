@@ -0,0 +1 @@
+"""Tools for running, timing and checking the daily solutions."""
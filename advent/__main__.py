@@ -0,0 +1,157 @@
+import argparse
+import sys
+
+from advent import client
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser.
+
+    Returns:
+        argparse.ArgumentParser: Parser with a sub-command per tool.
+    """
+    from advent import batch, bench, daemon, generators, profiling, runner
+    from advent.cache import ANSWER_CACHE_DIR, PARSE_CACHE_DIR
+    from advent.days import ROOT
+
+    parser = argparse.ArgumentParser(prog="python -m advent")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Solve days in parallel and time each phase.")
+    run.add_argument(
+        "--days", default="1-25", help="Days to run, i.e. 1-25 or 1,3,5-7."
+    )
+    run.add_argument(
+        "--jobs", type=int, help="Worker processes. Defaults to CPU count."
+    )
+    run.add_argument(
+        "--input", default="input.txt", help="Input file in each day folder."
+    )
+    run.add_argument(
+        "--report", default="run_report.json", help="JSON report to write."
+    )
+    run.add_argument(
+        "--parse-cache",
+        nargs="?",
+        const=str(PARSE_CACHE_DIR),
+        metavar="DIR",
+        help="Cache parsed inputs on disk, in DIR or "
+        f"{PARSE_CACHE_DIR.relative_to(ROOT)}.",
+    )
+    run.add_argument(
+        "--answer-cache",
+        default=str(ANSWER_CACHE_DIR),
+        metavar="DIR",
+        help="Folder of cached answers. Pass an empty string to disable.",
+    )
+    run.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute answers even if they are cached.",
+    )
+    run.set_defaults(func=runner.main)
+
+    solve_batch = commands.add_parser(
+        "batch", help="Solve one day for many inputs in parallel."
+    )
+    solve_batch.add_argument("--day", type=int, required=True, help="Day to solve.")
+    solve_batch.add_argument(
+        "--inputs", required=True, help="Folder or glob of input files."
+    )
+    solve_batch.add_argument(
+        "--parts", help="Parts to solve, i.e. part_1. Defaults to all."
+    )
+    solve_batch.add_argument(
+        "--jobs", type=int, help="Worker processes. Defaults to CPU count."
+    )
+    solve_batch.add_argument(
+        "--chunk-size", type=int, help="Inputs sent to a worker at once."
+    )
+    solve_batch.add_argument(
+        "--output",
+        help="File to write, CSV if it ends in .csv. Defaults to JSON lines on stdout.",
+    )
+    solve_batch.set_defaults(func=batch.main)
+
+    generate = commands.add_parser("generate", help="Write synthetic puzzle inputs.")
+    generate.add_argument("--days", default="1-25", help="Days to generate inputs for.")
+    generate.add_argument("--size", type=int, required=True, help="Size of each input.")
+    generate.add_argument("--seed", type=int, default=0, help="Random seed.")
+    generate.add_argument(
+        "--output-dir", default="generated", help="Folder to write to."
+    )
+    generate.add_argument(
+        "--option",
+        action="append",
+        help="Generator option as key=value, i.e. span=10000. Can be repeated.",
+    )
+    generate.set_defaults(func=generators.main)
+
+    benchmark = commands.add_parser("bench", help="Time days over growing inputs.")
+    benchmark.add_argument("--days", default="1-25", help="Days to benchmark.")
+    benchmark.add_argument("--repeat", type=int, default=5, help="Timed runs per size.")
+    benchmark.add_argument(
+        "--seed", type=int, default=0, help="Seed of generated inputs."
+    )
+    benchmark.add_argument(
+        "--baseline", default="bench_baseline.json", help="Baseline JSON."
+    )
+    benchmark.add_argument(
+        "--save", action="store_true", help="Store results as the baseline."
+    )
+    benchmark.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown, i.e. 0.25 for 25%%.",
+    )
+    benchmark.add_argument(
+        "--exponent-tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed growth exponent increase.",
+    )
+    benchmark.set_defaults(func=bench.main)
+
+    profile = commands.add_parser(
+        "profile", help="Profile the time and memory of each phase."
+    )
+    profile.add_argument("--days", required=True, help="Days to profile.")
+    profile.add_argument("--phases", help="Phases to profile, i.e. part_1,part_2.")
+    profile.add_argument(
+        "--input", default="input.txt", help="Input file in each day folder."
+    )
+    profile.add_argument("--top", type=int, default=20, help="Rows of each table.")
+    profile.add_argument("--output-dir", default="profiles", help="Folder to write to.")
+    profile.add_argument(
+        "--flamegraph", action="store_true", help="Also write sampled collapsed stacks."
+    )
+    profile.set_defaults(func=profiling.main)
+
+    serve = commands.add_parser("serve", help="Start a worker with every day imported.")
+    serve.add_argument("--days", default="1-25", help="Days to import.")
+    serve.add_argument(
+        "--socket", default=daemon.SOCKET_PATH, help="Socket to listen on."
+    )
+    serve.set_defaults(func=daemon.serve)
+
+    solve = commands.add_parser("client", help="Solve a day with a running worker.")
+    client.add_arguments(solve).set_defaults(func=client.main)
+
+    return parser
+
+
+def main(argv: list = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["client"]:
+        # A client is started for every request, so it skips importing the
+        # tools and solvers that build_parser needs.
+        parser = client.add_arguments(argparse.ArgumentParser(prog="advent client"))
+        client.main(parser.parse_args(argv[1:]))
+        return
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+import csv
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from advent.days import PHASES
+from advent.runner import run_day
+
+# Largest number of inputs sent to a worker at once. Small chunks keep a
+# slow input from holding back the results of many others.
+MAX_CHUNK_SIZE = 16
+
+
+def find_inputs(pattern: str) -> list:
+    """Find the input files of a batch.
+
+    Args:
+        pattern (str): Folder, whose files are all used, or glob pattern.
+
+    Returns:
+        list: Sorted absolute paths.
+    """
+    if os.path.isdir(pattern):
+        paths = (p for p in Path(pattern).iterdir() if p.is_file())
+    else:
+        paths = (Path(p) for p in glob.glob(pattern, recursive=True))
+    return sorted(str(p.resolve()) for p in paths)
+
+
+def chunk_size(inputs: int, jobs: int) -> int:
+    """Inputs per chunk, so each worker gets a few chunks.
+
+    Args:
+        inputs (int): Number of inputs.
+        jobs (int): Number of workers.
+
+    Returns:
+        int: Chunk size between 1 and MAX_CHUNK_SIZE.
+    """
+    return max(1, min(MAX_CHUNK_SIZE, inputs // (jobs * 4)))
+
+
+def solve_chunk(day: int, paths: list, parts: list = None) -> list:
+    """Solve a day for each input of a chunk.
+
+    Args:
+        day (int): Day number.
+        paths (list): Absolute paths of the inputs.
+        parts (list, optional): Parts to solve. Defaults to all.
+
+    Returns:
+        list: run_day result of each input, with its path under "input".
+    """
+    results = []
+    for path in paths:
+        result = run_day(day, path, parts=parts)
+        result["input"] = path
+        results.append(result)
+    return results
+
+
+def batch(
+    day: int, paths: list, jobs: int = None, size: int = None, parts: list = None
+):
+    """Solve a day for many inputs over a process pool.
+
+    Args:
+        day (int): Day number.
+        paths (list): Absolute paths of the inputs.
+        jobs (int, optional): Worker processes. Defaults to the CPU count.
+        size (int, optional): Inputs per chunk. Defaults to chunk_size.
+        parts (list, optional): Parts to solve. Defaults to all.
+
+    Yields:
+        dict: Result of each input, in the order they finish.
+    """
+    jobs = jobs or os.cpu_count()
+    size = size or chunk_size(len(paths), jobs)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(solve_chunk, day, paths[i : i + size], parts)
+            for i in range(0, len(paths), size)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+class JsonLinesWriter:
+    def __init__(self, f) -> None:
+        """Writes each result as a line of JSON."""
+        self.f = f
+
+    def write(self, result: dict) -> None:
+        self.f.write(json.dumps(result, default=str) + "\n")
+        self.f.flush()
+
+
+class CsvWriter:
+    FIELDS = (
+        ["input", "day"] + list(PHASES[1:]) + [f"{p}_ms" for p in PHASES] + ["error"]
+    )
+
+    def __init__(self, f) -> None:
+        """Writes each result as a CSV row with a column per answer and timing."""
+        self.f = f
+        self.writer = csv.DictWriter(f, self.FIELDS)
+        self.writer.writeheader()
+
+    def write(self, result: dict) -> None:
+        row = {"input": result["input"], "day": result["day"], "error": result["error"]}
+        row.update(result["answers"])
+        for phase, seconds in result["timings"].items():
+            row[f"{phase}_ms"] = f"{seconds * 1000:.3f}"
+        if row["error"]:
+            row["error"] = row["error"].strip().splitlines()[-1]
+        self.writer.writerow(row)
+        self.f.flush()
+
+
+def main(args) -> None:
+    """Entry point of the batch command.
+
+    Results are written as soon as each chunk finishes, as JSON lines or,
+    for --output files ending in .csv, as CSV.
+
+    Args:
+        args (argparse.Namespace): Command line arguments.
+    """
+    paths = find_inputs(args.inputs)
+    if not paths:
+        sys.exit(f"No inputs match {args.inputs}")
+    parts = args.parts.split(",") if args.parts else None
+
+    f = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        writer = (
+            CsvWriter(f) if str(args.output).endswith(".csv") else JsonLinesWriter(f)
+        )
+        errors = 0
+        for result in batch(args.day, paths, args.jobs, args.chunk_size, parts):
+            writer.write(result)
+            errors += result["error"] is not None
+    finally:
+        if f is not sys.stdout:
+            f.close()
+    print(f"Solved {len(paths)} inputs, {errors} errors", file=sys.stderr)
+
+
+# Tests
+
+
+def test_chunk_size():
+    assert chunk_size(1, 4) == 1
+    assert chunk_size(100, 4) == 6
+    assert chunk_size(10_000, 4) == MAX_CHUNK_SIZE
+
+
+def test_batch(tmp_path):
+    from advent.generators import write_input
+
+    for seed in range(5):
+        write_input(1, tmp_path / f"{seed}.txt", 100, seed)
+    (tmp_path / "bad.txt").write_text("not a number")
+    paths = find_inputs(str(tmp_path))
+    assert len(paths) == 6
+    assert find_inputs(str(tmp_path / "[0-2].txt")) == paths[:3]
+
+    results = list(batch(1, paths, jobs=2, size=2, parts=["part_1"]))
+    assert sorted(r["input"] for r in results) == paths
+    for result in results:
+        if result["input"].endswith("bad.txt"):
+            assert "ValueError" in result["error"]
+        else:
+            assert list(result["answers"]) == ["part_1"]
+
+
+def test_writers(tmp_path):
+    result = {
+        "input": "a.txt",
+        "day": 1,
+        "answers": {"part_1": 7},
+        "timings": {"parse": 0.001, "part_1": 0.002},
+        "cached": [],
+        "error": None,
+    }
+    with open(tmp_path / "out.csv", "w", newline="") as f:
+        CsvWriter(f).write(result)
+    with open(tmp_path / "out.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["part_1"] == "7"
+    assert rows[0]["part_1_ms"] == "2.000"
+    assert rows[0]["part_2"] == ""
+
+    with open(tmp_path / "out.jsonl", "w") as f:
+        JsonLinesWriter(f).write(result)
+    assert json.loads((tmp_path / "out.jsonl").read_text()) == result
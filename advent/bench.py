@@ -0,0 +1,298 @@
+import copy
+import json
+import math
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from advent.days import PHASES, get_phases, load_day
+from advent.generators import write_input
+
+# Input sizes to time each day at, and the phases worth timing. Sizes are
+# in the units of each day's generator. Day 11 part 2 may never finish on
+# a random grid, so it is left out. Day 21 inputs don't have a size.
+BENCHMARKS = {
+    1: {"sizes": [10_000, 20_000, 40_000, 80_000]},
+    2: {"sizes": [10_000, 20_000, 40_000, 80_000]},
+    3: {"sizes": [2_000, 4_000, 8_000, 16_000]},
+    4: {"sizes": [50, 100, 200, 400]},
+    5: {"sizes": [50, 100, 200, 400]},
+    6: {"sizes": [10_000, 20_000, 40_000, 80_000]},
+    7: {"sizes": [10_000, 20_000, 40_000, 80_000]},
+    8: {"sizes": [2_000, 4_000, 8_000, 16_000]},
+    9: {"sizes": [50, 100, 200, 400]},
+    10: {"sizes": [500, 1_000, 2_000, 4_000]},
+    11: {"sizes": [10, 20, 40, 80], "phases": ("parse", "part_1")},
+    12: {"sizes": [4, 6, 8, 10]},
+    13: {"sizes": [500, 1_000, 2_000, 4_000]},
+    14: {"sizes": [1_000, 2_000, 4_000, 8_000]},
+    15: {"sizes": [10, 20, 40, 60]},
+    16: {"sizes": [500, 1_000, 2_000, 4_000]},
+    17: {"sizes": [10, 20, 40, 80]},
+    18: {"sizes": [10, 20, 30, 40]},
+    19: {"sizes": [2, 3, 4, 6]},
+    20: {"sizes": [10, 20, 40, 80]},
+    22: {"sizes": [5, 10, 20, 40]},
+    25: {"sizes": [20, 40, 60, 80]},
+}
+
+# Timings shorter than this are too noisy to compare against a baseline.
+MIN_TIME = 0.001
+
+
+def benchmark_config(day: int) -> dict:
+    """Sizes and phases to benchmark a day at.
+
+    Days without an entry in BENCHMARKS can define BENCHMARK in their own
+    module, as days made from utils/day_template.py do.
+
+    Args:
+        day (int): Day number.
+
+    Returns:
+        dict: Benchmark of the day, or None if it has none.
+    """
+    if day in BENCHMARKS:
+        return BENCHMARKS[day]
+    try:
+        return getattr(load_day(day), "BENCHMARK", None)
+    except FileNotFoundError:
+        return None
+
+
+def time_phase(func, arg, repeat: int) -> tuple:
+    """Time a phase several times, then measure its peak memory.
+
+    Each run gets its own copy of arg, made outside of the timed region.
+
+    Args:
+        func (callable): Phase to run.
+        arg: Input file or parsed input to pass to func.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        tuple: Median time in seconds and peak memory in MB.
+    """
+    times = []
+    for _ in range(repeat):
+        run_arg = copy.deepcopy(arg)
+        start = time.perf_counter()
+        func(run_arg)
+        times.append(time.perf_counter() - start)
+
+    run_arg = copy.deepcopy(arg)
+    tracemalloc.start()
+    func(run_arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak / 2 ** 20
+
+
+def fit_exponent(sizes: list, times: list) -> float:
+    """Fit time = c * size ** k and return the growth exponent k.
+
+    Uses a least squares fit on a log-log scale.
+
+    Args:
+        sizes (list): Input sizes.
+        times (list): Time taken at each size.
+
+    Returns:
+        float: Growth exponent, or None with fewer than two usable points.
+    """
+    points = [
+        (math.log(s), math.log(t)) for s, t in zip(sizes, times) if s > 0 and t > 0
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = statistics.mean(x for x, _ in points)
+    mean_y = statistics.mean(y for _, y in points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return cov / var_x
+
+
+def benchmark_day(day: int, sizes: list = None, repeat: int = 5, seed: int = 0) -> dict:
+    """Benchmark each phase of a day over a ladder of generated inputs.
+
+    Args:
+        day (int): Day number.
+        sizes (list, optional): Input sizes. Defaults to the day's ladder.
+        repeat (int, optional): Timed runs per phase and size. Defaults to 5.
+        seed (int, optional): Seed of the generated inputs. Defaults to 0.
+
+    Returns:
+        dict: Per phase, the sizes, median times, peak memory and the
+        fitted growth exponent.
+    """
+    benchmark = benchmark_config(day) or {}
+    sizes = sizes or benchmark["sizes"]
+    phases = get_phases(day)
+    wanted = [p for p in benchmark.get("phases", PHASES) if phases[p] is not None]
+    results = {p: {"sizes": [], "median": [], "peak_mb": []} for p in wanted}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = write_input(day, Path(tmp) / f"{size}.txt", size, seed)
+            data = phases["parse"](path)
+            for phase in wanted:
+                arg = path if phase == "parse" else data
+                median, peak = time_phase(phases[phase], arg, repeat)
+                results[phase]["sizes"].append(size)
+                results[phase]["median"].append(median)
+                results[phase]["peak_mb"].append(peak)
+
+    for result in results.values():
+        result["exponent"] = fit_exponent(result["sizes"], result["median"])
+    return results
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    tolerance: float = 0.25,
+    exponent_tolerance: float = 0.5,
+) -> list:
+    """Compare benchmark results against a stored baseline.
+
+    Args:
+        results (dict): Day (as str) to benchmark_day results.
+        baseline (dict): Baseline in the same format.
+        tolerance (float, optional): Allowed slowdown as a fraction of the
+        baseline time. Defaults to 0.25.
+        exponent_tolerance (float, optional): Allowed increase of the growth
+        exponent. Defaults to 0.5.
+
+    Returns:
+        list: Description of each regression found.
+    """
+    regressions = []
+    for day, phases in results.items():
+        for phase, result in phases.items():
+            base = baseline.get(day, {}).get(phase)
+            if not base:
+                continue
+            base_times = dict(zip(base["sizes"], base["median"]))
+            for size, median in zip(result["sizes"], result["median"]):
+                base_time = base_times.get(size)
+                if base_time is None or max(median, base_time) < MIN_TIME:
+                    continue
+                if median > base_time * (1 + tolerance):
+                    regressions.append(
+                        f"day {day} {phase} size {size}: {median * 1000:.1f}ms "
+                        f"vs baseline {base_time * 1000:.1f}ms"
+                    )
+            exponent, base_exponent = result["exponent"], base.get("exponent")
+            if exponent is not None and base_exponent is not None:
+                if exponent > base_exponent + exponent_tolerance:
+                    regressions.append(
+                        f"day {day} {phase}: grows as size^{exponent:.2f} "
+                        f"vs baseline size^{base_exponent:.2f}"
+                    )
+    return regressions
+
+
+def format_results(results: dict) -> str:
+    """Format benchmark results as a table.
+
+    Args:
+        results (dict): Day (as str) to benchmark_day results.
+
+    Returns:
+        str: Printable table.
+    """
+    header = (
+        f"{'Day':>3}  {'Phase':<6}  {'Size':>8}  {'Median':>10}  {'Peak':>9}  Exponent"
+    )
+    lines = [header, "-" * len(header)]
+    for day, phases in results.items():
+        for phase, result in phases.items():
+            exponent = result["exponent"]
+            exponent = "-" if exponent is None else f"{exponent:.2f}"
+            rows = zip(result["sizes"], result["median"], result["peak_mb"])
+            for i, (size, median, peak) in enumerate(rows):
+                last = exponent if i == len(result["sizes"]) - 1 else ""
+                lines.append(
+                    f"{day:>3}  {phase:<6}  {size:>8}  {median * 1000:>8.2f}ms  "
+                    f"{peak:>7.2f}MB  {last}"
+                )
+    return "\n".join(lines)
+
+
+def main(args) -> None:
+    """Entry point of the bench command.
+
+    Exits with status 1 when a regression against the baseline is found.
+
+    Args:
+        args (argparse.Namespace): Command line arguments.
+    """
+    from advent.runner import parse_days
+
+    days = [day for day in parse_days(args.days) if benchmark_config(day)]
+    results = {}
+    for day in days:
+        results[str(day)] = benchmark_day(day, repeat=args.repeat, seed=args.seed)
+        print(f"Day {day} done", file=sys.stderr)
+    print(format_results(results))
+
+    baseline_file = Path(args.baseline)
+    if args.save:
+        baseline = (
+            json.loads(baseline_file.read_text()) if baseline_file.exists() else {}
+        )
+        baseline.update(results)
+        baseline_file.write_text(json.dumps(baseline, indent=2))
+        print(f"Saved baseline to {baseline_file}")
+    elif baseline_file.exists():
+        baseline = json.loads(baseline_file.read_text())
+        regressions = compare(
+            results, baseline, args.tolerance, args.exponent_tolerance
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {baseline_file}")
+    else:
+        print(f"No baseline at {baseline_file}, run with --save to create one")
+
+
+# Tests
+
+
+def test_fit_exponent():
+    sizes = [10, 20, 40, 80]
+    assert math.isclose(fit_exponent(sizes, [s * 0.5 for s in sizes]), 1)
+    assert math.isclose(fit_exponent(sizes, [s ** 2 for s in sizes]), 2)
+    assert fit_exponent([10], [1.0]) is None
+
+
+def test_benchmark_day():
+    results = benchmark_day(1, sizes=[100, 200], repeat=1)
+    assert set(results) == {"parse", "part_1", "part_2"}
+    assert results["part_1"]["sizes"] == [100, 200]
+    assert all(t > 0 for t in results["part_1"]["median"])
+    assert all(m > 0 for m in results["parse"]["peak_mb"])
+
+
+def test_compare():
+    baseline = {
+        "1": {"part_1": {"sizes": [10, 20], "median": [0.01, 0.02], "exponent": 1.0}}
+    }
+    same = {
+        "1": {"part_1": {"sizes": [10, 20], "median": [0.011, 0.021], "exponent": 1.0}}
+    }
+    slower = {
+        "1": {"part_1": {"sizes": [10, 20], "median": [0.01, 0.08], "exponent": 3.0}}
+    }
+    assert compare(same, baseline) == []
+    regressions = compare(slower, baseline)
+    assert len(regressions) == 2
+    assert "size 20" in regressions[0]
+    assert "size^3.00" in regressions[1]
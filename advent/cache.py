@@ -0,0 +1,273 @@
+import hashlib
+import inspect
+import os
+import pickle
+from pathlib import Path
+
+from advent import days
+from advent.days import ROOT, day_name
+
+PARSE_CACHE_DIR = ROOT / ".cache" / "parse"
+ANSWER_CACHE_DIR = ROOT / ".cache" / "answers"
+
+# Cached entries are evicted, least recently used first, past this size.
+MAX_BYTES = 256 * 2 ** 20
+
+
+def file_hash(path) -> str:
+    """SHA-256 of a file's contents.
+
+    Args:
+        path (str | Path): File to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(2 ** 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_hash(day: int) -> str:
+    """Hash of the source code a day's parser depends on.
+
+    This is the day's module and the shared utils package, so editing
+    either one invalidates the cached inputs of the day.
+
+    Args:
+        day (int): Day number.
+
+    Returns:
+        str: Hex digest.
+    """
+    name = day_name(day)
+    sources = [ROOT / name / f"{name}.py"] + sorted((ROOT / "utils").glob("*.py"))
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def solver_source(day: int, phase: str) -> str:
+    """Source of how the runner calls a phase of a day.
+
+    This holds the parameters of the phase, such as the 80 and 256 days of
+    day 6 or the 100 steps of day 11, along with any helper in advent.days
+    the phase goes through.
+
+    Args:
+        day (int): Day number.
+        phase (str): Phase name.
+
+    Returns:
+        str: Source code, or the phase name for days using the default layout.
+    """
+    solver = days.SOLVERS.get(day, {}).get(phase)
+    if solver is None:
+        return phase
+    source = inspect.getsource(solver)
+    helper = getattr(days, f"_day{day}", None)
+    if helper is not None:
+        source += inspect.getsource(helper)
+    return source
+
+
+class DiskCache:
+    def __init__(self, directory, max_bytes: int = MAX_BYTES) -> None:
+        """On-disk cache of values stored as pickles.
+
+        Each entry is a file named after its key. Reading an entry updates
+        its modification time, which is used to evict the least recently
+        used entries once the cache grows past max_bytes.
+
+        Args:
+            directory (str | Path): Folder of the cache.
+            max_bytes (int, optional): Size cap of the cache. Defaults to 256MB.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key: str):
+        """Load a cached entry.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            tuple: True and the cached value, or False and None on a miss.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+        os.utime(path)
+        return True, value
+
+    def put(self, key: str, value) -> None:
+        """Store an entry, then evict old entries over the size cap.
+
+        Values that can't be pickled are not cached.
+
+        Args:
+            key (str): Cache key.
+            value: Value to store.
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until under the size cap."""
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+
+
+class ParseCache(DiskCache):
+    def __init__(self, directory=PARSE_CACHE_DIR, max_bytes: int = MAX_BYTES) -> None:
+        """Cache of parsed inputs.
+
+        Args:
+            directory (str | Path, optional): Folder of the cache.
+            Defaults to .cache/parse in the repository.
+            max_bytes (int, optional): Size cap of the cache. Defaults to 256MB.
+        """
+        super().__init__(directory, max_bytes)
+
+    def key(self, day: int, input_file) -> str:
+        """Cache key of a day's input.
+
+        Args:
+            day (int): Day number.
+            input_file (str | Path): Input file.
+
+        Returns:
+            str: Key combining the day, its parser source and the input bytes.
+        """
+        digest = hashlib.sha256(f"{source_hash(day)}:{file_hash(input_file)}".encode())
+        return f"{day_name(day)}-{digest.hexdigest()[:32]}"
+
+    def parse(self, day: int, parse, input_file):
+        """Parse an input, or load it from the cache.
+
+        Args:
+            day (int): Day number.
+            parse (callable): Parser of the day, taking the input file.
+            input_file (str | Path): Input file.
+
+        Returns:
+            The parsed input.
+        """
+        key = self.key(day, input_file)
+        hit, data = self.get(key)
+        if not hit:
+            data = parse(input_file)
+            self.put(key, data)
+        return data
+
+
+class AnswerCache(DiskCache):
+    def __init__(self, directory=ANSWER_CACHE_DIR, max_bytes: int = MAX_BYTES) -> None:
+        """Cache of the answers of each part.
+
+        Args:
+            directory (str | Path, optional): Folder of the cache.
+            Defaults to .cache/answers in the repository.
+            max_bytes (int, optional): Size cap of the cache. Defaults to 256MB.
+        """
+        super().__init__(directory, max_bytes)
+
+    def key(self, day: int, phase: str, input_file) -> str:
+        """Cache key of the answer of a part.
+
+        Args:
+            day (int): Day number.
+            phase (str): Part, i.e. "part_1".
+            input_file (str | Path): Input file.
+
+        Returns:
+            str: Key combining the input bytes, the day's source and the
+            parameters the part is solved with.
+        """
+        parts = (source_hash(day), solver_source(day, phase), file_hash(input_file))
+        digest = hashlib.sha256("\0".join(parts).encode())
+        return f"{day_name(day)}-{phase}-{digest.hexdigest()[:32]}"
+
+
+# Tests
+
+
+def test_parse_cache(tmp_path):
+    from advent.days import get_phases, input_path
+
+    cache = ParseCache(tmp_path)
+    parse = get_phases(15)["parse"]
+    input_file = input_path(15, "example1.txt")
+    first = cache.parse(15, parse, input_file)
+    key = cache.key(15, input_file)
+    assert cache.get(key) == (True, first)
+    assert cache.parse(15, lambda _: None, input_file) == first
+
+
+def test_parse_cache_key(tmp_path):
+    cache = ParseCache(tmp_path)
+    a = tmp_path / "a.txt"
+    a.write_text("199\n200")
+    key = cache.key(1, a)
+    assert cache.key(2, a) != key
+    a.write_text("199\n201")
+    assert cache.key(1, a) != key
+
+
+def test_parse_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path)
+    for key in "abc":
+        cache.put(key, bytes(1_000))
+        os.utime(cache._path(key), (0, ord(key)))
+    cache.get("a")
+    cache.max_bytes = 2_500
+    cache.put("d", bytes(1_000))
+    assert sorted(p.stem for p in tmp_path.glob("*.pickle")) == ["a", "d"]
+    assert cache.get("b") == (False, None)
+
+
+def test_answer_cache_key(tmp_path):
+    from advent.days import input_path
+
+    cache = AnswerCache(tmp_path)
+    input_file = input_path(6, "example.txt")
+    key = cache.key(6, "part_1", input_file)
+    assert cache.key(6, "part_2", input_file) != key
+    assert cache.key(1, "part_1", input_file) != key
+    assert "80" in solver_source(6, "part_1")
+    assert "_day20" in solver_source(20, "part_2")
+    assert solver_source(1, "part_1") == "part_1"
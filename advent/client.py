@@ -0,0 +1,78 @@
+import argparse
+import json
+import os
+import socket
+import sys
+
+# Socket of the worker, .cache/worker.sock in the repository. Worked out
+# with os.path rather than advent.days.ROOT, as the client only imports
+# what it needs to talk to the worker, see advent/__main__.py.
+SOCKET_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "worker.sock"
+)
+
+
+def request(message: dict, socket_path=SOCKET_PATH, timeout: float = None) -> dict:
+    """Send one request to a running worker and wait for its reply.
+
+    Args:
+        message (dict): Request, see advent.daemon.Handler.
+        socket_path (str | Path, optional): Socket of the worker.
+        Defaults to .cache/worker.sock in the repository.
+        timeout (float, optional): Seconds to wait. Defaults to no limit.
+
+    Returns:
+        dict: Reply of the worker.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(message).encode() + b"\n")
+        with sock.makefile("rb") as reply:
+            return json.loads(reply.readline())
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Add the arguments of the client command to a parser.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser to add to.
+
+    Returns:
+        argparse.ArgumentParser: The same parser.
+    """
+    parser.add_argument("--day", type=int, help="Day to solve.")
+    parser.add_argument("--parts", help="Parts to solve, i.e. part_1. Defaults to all.")
+    parser.add_argument("--input", default="-", help="Input file, or - to read stdin.")
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Socket of the worker.")
+    parser.add_argument("--stop", action="store_true", help="Stop the worker.")
+    return parser
+
+
+def main(args) -> None:
+    """Entry point of the client command.
+
+    Prints the answers, one per line, and the timings to stderr. Exits
+    with status 1 if the worker reports an error.
+
+    Args:
+        args (argparse.Namespace): Command line arguments.
+    """
+    if args.stop:
+        message = {"command": "stop"}
+    else:
+        message = {"day": args.day}
+        if args.parts:
+            message["parts"] = args.parts.split(",")
+        if args.input == "-":
+            message["data"] = sys.stdin.read()
+        else:
+            message["input"] = os.path.abspath(args.input)
+    reply = request(message, args.socket)
+    if reply.get("error"):
+        print(reply["error"], file=sys.stderr)
+        sys.exit(1)
+    for answer in reply.get("answers", {}).values():
+        print(answer)
+    for phase, seconds in reply.get("timings", {}).items():
+        print(f"{phase}: {seconds * 1000:.2f}ms", file=sys.stderr)
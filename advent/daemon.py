@@ -0,0 +1,143 @@
+import json
+import os
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from advent.client import SOCKET_PATH, request
+from advent.days import get_phases
+from advent.runner import parse_days, run_day
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Answers requests of one connection, one JSON object per line.
+
+    A request is {"day": 1, "parts": ["part_1"], "input": "/path/to/input"}
+    or, with the input itself, {"day": 1, "data": "199\\n200\\n..."}. "parts"
+    defaults to every solved part. The reply is a line holding the result
+    of run_day. {"command": "ping"} and {"command": "stop"} check on and
+    stop the worker.
+    """
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                reply = self.server.answer(json.loads(line))
+            except Exception as e:
+                reply = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(reply, default=str).encode() + b"\n")
+            self.wfile.flush()
+            if reply.get("stopping"):
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+
+class Worker(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path=SOCKET_PATH, days: list = None) -> None:
+        """Long-running solver listening on a Unix domain socket.
+
+        Every day's module is imported up front, so requests only pay for
+        parsing and solving.
+
+        Args:
+            socket_path (str | Path, optional): Socket to listen on.
+            Defaults to .cache/worker.sock in the repository.
+            days (list, optional): Days to import. Defaults to all of them.
+        """
+        self.socket_path = Path(socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        self.days = days or list(range(1, 26))
+        for day in self.days:
+            get_phases(day)
+        super().__init__(str(self.socket_path), Handler)
+
+    def answer(self, request: dict) -> dict:
+        """Answer one request.
+
+        Args:
+            request (dict): Decoded request, see Handler.
+
+        Returns:
+            dict: Reply to send back.
+        """
+        command = request.get("command", "solve")
+        if command == "ping":
+            return {"days": self.days, "pid": os.getpid()}
+        if command == "stop":
+            return {"stopping": True}
+
+        day = int(request["day"])
+        parts = request.get("parts")
+        if "data" not in request:
+            return run_day(day, str(Path(request["input"]).resolve()), parts=parts)
+        with tempfile.NamedTemporaryFile("w", suffix=".txt") as f:
+            f.write(request["data"])
+            f.flush()
+            return run_day(day, f.name, parts=parts)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def serve(args) -> None:
+    """Entry point of the serve command.
+
+    Args:
+        args (argparse.Namespace): Command line arguments.
+    """
+    start = time.perf_counter()
+    with Worker(args.socket, parse_days(args.days)) as worker:
+        print(
+            f"Imported {len(worker.days)} days in {time.perf_counter() - start:.3f}s, "
+            f"listening on {worker.socket_path}",
+            file=sys.stderr,
+        )
+        try:
+            worker.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+# Tests
+
+
+def test_worker(tmp_path):
+    from advent.days import input_path
+
+    socket_path = tmp_path / "worker.sock"
+    worker = Worker(socket_path, days=[1, 2])
+    thread = threading.Thread(target=worker.serve_forever)
+    thread.start()
+    try:
+        assert request({"command": "ping"}, socket_path, timeout=5)["days"] == [1, 2]
+
+        reply = request(
+            {"day": 1, "input": str(input_path(1, "example.txt"))}, socket_path, 5
+        )
+        assert reply["answers"] == {"part_1": 7, "part_2": 5}
+        assert set(reply["timings"]) == {"parse", "part_1", "part_2"}
+
+        data = input_path(2, "example.txt").read_text()
+        reply = request({"day": 2, "parts": ["part_2"], "data": data}, socket_path, 5)
+        assert reply["answers"] == {"part_2": 900}
+
+        reply = request({"day": 1}, socket_path, 5)
+        assert "KeyError" in reply["error"]
+
+        assert request({"command": "stop"}, socket_path, 5) == {"stopping": True}
+        thread.join(5)
+        assert not thread.is_alive()
+    finally:
+        worker.shutdown()
+        worker.server_close()
+    assert not socket_path.exists()
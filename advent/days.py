@@ -0,0 +1,230 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PHASES = ("parse", "part_1", "part_2")
+
+# Days that don't follow the parse_input / part_1 / part_2 layout.
+# Each phase takes the day module and either the input file (parse) or the
+# parsed input (part_1, part_2). None marks a part that isn't solved yet.
+SOLVERS = {
+    4: {
+        "part_1": lambda m, data: m.part_1(*data),
+        "part_2": lambda m, data: m.part_2(*data),
+    },
+    6: {
+        "part_1": lambda m, fish: m.stimulate_fish(fish, 80),
+        "part_2": lambda m, fish: m.stimulate_fish(fish, 256),
+    },
+    7: {
+        "part_1": lambda m, crabs: m.min_fuel_median(crabs),
+        "part_2": lambda m, crabs: m.min_fuel_mean(crabs),
+    },
+    8: {
+        "part_2": None,
+    },
+    9: {
+        "part_1": lambda m, grid: m.Cave(grid).calculate_risk_level(),
+        "part_2": lambda m, grid: m.Cave(grid).part_2(),
+    },
+    10: {
+        "part_1": lambda m, subsystem: m.calculate_syntax_checker_score(subsystem),
+        "part_2": lambda m, subsystem: m.calculate_autocomplete_score(subsystem),
+    },
+    11: {
+        "part_1": lambda m, lights: m.Octopi(lights).part_1(100),
+        "part_2": lambda m, lights: m.Octopi(lights).part_2(),
+    },
+    13: {
+        "part_1": lambda m, data: m.part_1(*data),
+        "part_2": lambda m, data: m.part_2(*data),
+    },
+    14: {
+        "part_1": lambda m, data: m.evolve_polymer(*data, 10),
+        "part_2": lambda m, data: m.evolve_polymer(*data, 40),
+    },
+    15: {
+        "part_1": lambda m, grid: _day15(m, grid, 1),
+        "part_2": lambda m, grid: _day15(m, grid, 5),
+    },
+    16: {
+        "part_1": lambda m, hex_rep: _day16(m, hex_rep)[0],
+        "part_2": lambda m, hex_rep: _day16(m, hex_rep)[1],
+    },
+    17: {
+        "part_1": lambda m, target: m.part_1(target[2]),
+        "part_2": lambda m, target: m.part_2(*target),
+    },
+    18: {
+        "part_1": lambda m, snailfish: m.add_snailfish(snailfish),
+        "part_2": lambda m, snailfish: m.largest_added_magnitude(snailfish),
+    },
+    19: {
+        "part_1": lambda m, scanners: len(m.assemble_beacon_map(scanners).beacons),
+        "part_2": lambda m, scanners: m.assemble_beacon_map(scanners).max_md,
+    },
+    20: {
+        "part_1": lambda m, enhance: _day20(enhance, 2),
+        "part_2": lambda m, enhance: _day20(enhance, 50),
+    },
+    21: {
+        "part_1": lambda m, positions: m.part_1(*positions),
+        "part_2": lambda m, positions: max(m.part_2(*positions)),
+    },
+    22: {
+        "part_2": None,
+    },
+    23: {
+        "parse": None,
+        "part_1": None,
+        "part_2": None,
+    },
+    24: {
+        "parse": None,
+        "part_1": None,
+        "part_2": None,
+    },
+    25: {
+        "part_1": lambda m, cucs: cucs.step_until_still(),
+        "part_2": None,
+    },
+}
+
+
+def _day15(m, grid: list, enlarge: int) -> int:
+    cavern = m.Cavern(grid)
+    if enlarge > 1:
+        cavern.enlarge_cavern(enlarge)
+    return cavern.minimum_path((cavern.max_x, cavern.max_y))
+
+
+def _day16(m, hex_rep: str) -> tuple:
+    transmission = m.Bits(hex_rep)
+    value = m.decode(transmission)
+    return transmission.version_sum, value
+
+
+def _day20(enhance, steps: int) -> int:
+    enhance.step(steps)
+    return enhance.lit_pixels
+
+
+def day_name(day: int) -> str:
+    """Name of a day's folder and module.
+
+    Args:
+        day (int): Day number. I.e. 5.
+
+    Returns:
+        str: Day name. I.e. "day05".
+    """
+    return f"day{day:02d}"
+
+
+def load_day(day: int):
+    """Import a day's module from its folder.
+
+    The module is registered under the same name pytest gives it, so the
+    runner and the test suite share one copy.
+
+    Args:
+        day (int): Day number.
+
+    Returns:
+        module: The day's module.
+    """
+    name = day_name(day)
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, ROOT / name / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Don't leave a half initialised module behind for later calls.
+        del sys.modules[name]
+        raise
+    return module
+
+
+def input_path(day: int, input_name: str = "input.txt") -> Path:
+    """Path to one of a day's input files.
+
+    Args:
+        day (int): Day number.
+        input_name (str, optional): File name within the day's folder, or
+        an absolute path which is used as is. Defaults to "input.txt".
+
+    Returns:
+        Path: Input file path.
+    """
+    return ROOT / day_name(day) / input_name
+
+
+def get_phases(day: int) -> dict:
+    """Get the callables that parse and solve a day.
+
+    Args:
+        day (int): Day number.
+
+    Returns:
+        dict: Phase name to a callable, or None if the phase isn't solved.
+        "parse" takes an input file, the parts take the parsed input.
+    """
+    module = load_day(day)
+    solver = SOLVERS.get(day, {})
+    phases = {}
+    for phase in PHASES:
+        if phase in solver:
+            func = solver[phase]
+        elif phase == "parse":
+            func = lambda m, input_file: m.parse_input(input_file)
+        else:
+            func = lambda m, data, name=phase: getattr(m, name)(data)
+
+        if func is None:
+            phases[phase] = None
+        else:
+            phases[phase] = lambda arg, func=func: func(module, arg)
+    return phases
+
+
+# Tests
+
+
+def test_day_name():
+    assert day_name(5) == "day05"
+    assert day_name(25) == "day25"
+
+
+def test_get_phases():
+    phases = get_phases(1)
+    depths = phases["parse"](input_path(1, "example.txt"))
+    assert phases["part_1"](depths) == 7
+    assert phases["part_2"](depths) == 5
+
+
+def test_get_phases_class_based():
+    phases = get_phases(9)
+    grid = phases["parse"](input_path(9, "example.txt"))
+    assert phases["part_1"](grid) == 15
+    assert phases["part_2"](grid) == 1134
+
+
+def test_get_phases_unsolved():
+    phases = get_phases(23)
+    assert all(phases[phase] is None for phase in PHASES)
+
+
+def test_load_day_failure():
+    for _ in range(2):
+        try:
+            load_day(26)
+        except FileNotFoundError:
+            pass
+        else:
+            raise AssertionError("loaded a day that doesn't exist")
+    assert "day26" not in sys.modules
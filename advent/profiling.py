@@ -0,0 +1,352 @@
+import copy
+import cProfile
+import io
+import pstats
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+from advent.days import PHASES, day_name, get_phases, input_path
+
+# Seconds of CPU time between stack samples for collapsed stacks.
+SAMPLE_INTERVAL = 0.001
+
+# Seconds between checks of the traced memory, and how much it has to grow
+# past the last snapshot before another is taken.
+SNAPSHOT_INTERVAL = 0.002
+SNAPSHOT_GROWTH = 1.25
+
+
+class StackSampler:
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        """Sampling profiler counting call stacks on a CPU time timer.
+
+        Uses SIGPROF, so it only works on Unix and in the main thread.
+
+        Args:
+            interval (float, optional): Seconds of CPU time between samples.
+            Defaults to 1ms.
+        """
+        self.interval = interval
+        self.stacks = Counter()
+        self._base = None
+
+    def _sample(self, signum, frame) -> None:
+        # Keep the handler cheap, stacks of code objects are named later.
+        stack = []
+        while frame is not None and frame is not self._base:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        if stack:
+            self.stacks[tuple(stack)] += 1
+
+    def run(self, func, arg):
+        """Call func(arg) while sampling its stack.
+
+        Frames above this call are left out of the samples.
+
+        Args:
+            func (callable): Function to run.
+            arg: Argument to pass to func.
+
+        Returns:
+            The return value of func.
+        """
+        self._base = sys._getframe()
+        previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return func(arg)
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+
+    def collapsed(self) -> str:
+        """Samples in the collapsed stack format of flamegraph.pl and speedscope.
+
+        Returns:
+            str: One "frame;frame;frame count" line per stack.
+        """
+        lines = []
+        for stack, count in self.stacks.most_common():
+            frames = (
+                f"{Path(code.co_filename).stem}:{code.co_name}"
+                for code in reversed(stack)
+            )
+            lines.append(f"{';'.join(frames)} {count}")
+        return "\n".join(lines)
+
+
+class PeakSnapshot:
+    def __init__(
+        self, interval: float = SNAPSHOT_INTERVAL, growth: float = SNAPSHOT_GROWTH
+    ) -> None:
+        """Tracemalloc snapshot of the allocations at their peak during a run.
+
+        A thread watches the traced memory and takes a snapshot whenever it
+        has grown past the last one, so the snapshot shows what the run
+        allocated, not only what survived it.
+
+        Args:
+            interval (float, optional): Seconds between checks. Defaults to 2ms.
+            growth (float, optional): Factor the traced memory has to grow by
+            before a new snapshot is taken. Defaults to 1.25.
+        """
+        self.interval = interval
+        self.growth = growth
+        self.before = None
+        self.snapshot = None
+        self.peak = 0
+        self._size = 0
+        self._stop = threading.Event()
+
+    def _take(self) -> None:
+        size, _ = tracemalloc.get_traced_memory()
+        if size > self._size:
+            self.snapshot = tracemalloc.take_snapshot()
+            self._size = size * self.growth
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._take()
+
+    def run(self, func, arg):
+        """Call func(arg) under tracemalloc, snapshotting its peak.
+
+        The result is kept alive until the final snapshot is taken.
+
+        Args:
+            func (callable): Function to run.
+            arg: Argument to pass to func.
+
+        Returns:
+            The return value of func.
+        """
+        thread = threading.Thread(target=self._watch)
+        tracemalloc.start()
+        self.before = tracemalloc.take_snapshot()
+        self._size = tracemalloc.get_traced_memory()[0]
+        thread.start()
+        try:
+            result = func(arg)
+        finally:
+            self._stop.set()
+            thread.join()
+            _, self.peak = tracemalloc.get_traced_memory()
+            self._take()
+            tracemalloc.stop()
+        return result
+
+    def allocations(self, top: int = 20) -> list:
+        """Lines holding the most memory at the peak, beyond what they held before.
+
+        Args:
+            top (int, optional): Number of lines. Defaults to 20.
+
+        Returns:
+            list: Dicts of the line, the count of its new blocks and their
+            size in KB, largest first.
+        """
+        if self.snapshot is None:
+            return []
+        own = [
+            tracemalloc.Filter(False, module.__file__)
+            for module in (tracemalloc, threading)
+        ]
+        snapshot = self.snapshot.filter_traces(own)
+        before = self.before.filter_traces(own)
+        return [
+            {
+                "line": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "count": stat.count_diff,
+                "kb": stat.size_diff / 2 ** 10,
+            }
+            for stat in snapshot.compare_to(before, "lineno")[:top]
+            if stat.size_diff > 0
+        ]
+
+
+def profile_phase(func, arg, top: int = 20, sample: bool = False) -> dict:
+    """Profile one phase of a day.
+
+    The phase is run once under cProfile, once under tracemalloc and, if
+    asked, once under a StackSampler, each time on its own copy of arg.
+
+    Args:
+        func (callable): Phase to run.
+        arg: Input file or parsed input to pass to func.
+        top (int, optional): Rows of the hot function and allocation tables.
+        Defaults to 20.
+        sample (bool, optional): Also collect stack samples. Defaults to False.
+
+    Returns:
+        dict: The cProfile stats, hot function tables by own and cumulative
+        time, peak memory in MB, the top allocations by line at the peak and collapsed
+        stacks (or None).
+    """
+    profiler = cProfile.Profile()
+    run_arg = copy.deepcopy(arg)
+    profiler.enable()
+    func(run_arg)
+    profiler.disable()
+    stats = pstats.Stats(profiler)
+    table = io.StringIO()
+    stats.stream = table
+    stats.sort_stats("tottime").print_stats(top)
+    stats.sort_stats("cumulative").print_stats(top)
+
+    peak = PeakSnapshot()
+    peak.run(func, copy.deepcopy(arg))
+    allocations = peak.allocations(top)
+
+    collapsed = None
+    if sample:
+        sampler = StackSampler()
+        sampler.run(func, copy.deepcopy(arg))
+        collapsed = sampler.collapsed()
+
+    return {
+        "stats": stats,
+        "hot_functions": table.getvalue(),
+        "peak_mb": peak.peak / 2 ** 20,
+        "allocations": allocations,
+        "collapsed": collapsed,
+    }
+
+
+def format_profile(day: int, phase: str, profile: dict) -> str:
+    """Format the profile of a phase as a text report.
+
+    Args:
+        day (int): Day number.
+        phase (str): Phase name.
+        profile (dict): Result of profile_phase.
+
+    Returns:
+        str: Printable report.
+    """
+    lines = [f"Day {day} {phase}", f"Peak memory: {profile['peak_mb']:.2f}MB", ""]
+    lines.append("Hot functions:")
+    lines.append(profile["hot_functions"].strip())
+    lines.append("")
+    lines.append("Allocations held at the peak, by line:")
+    lines.append(f"{'Count':>10}  {'Size':>10}  Line")
+    for allocation in profile["allocations"]:
+        count, kb, line = allocation["count"], allocation["kb"], allocation["line"]
+        lines.append(f"{count:>10}  {kb:>8.1f}KB  {line}")
+    return "\n".join(lines)
+
+
+def profile_day(
+    day: int,
+    input_name: str = "input.txt",
+    phases: tuple = PHASES,
+    top: int = 20,
+    sample: bool = False,
+) -> dict:
+    """Profile the phases of a day.
+
+    Args:
+        day (int): Day number.
+        input_name (str, optional): Input file within the day's folder.
+        Defaults to "input.txt".
+        phases (tuple, optional): Phases to profile. Defaults to all of them.
+        top (int, optional): Rows of each table. Defaults to 20.
+        sample (bool, optional): Also collect stack samples. Defaults to False.
+
+    Returns:
+        dict: Phase name to its profile_phase result. Unsolved phases are
+        left out.
+    """
+    funcs = get_phases(day)
+    if funcs["parse"] is None:
+        return {}
+    input_file = input_path(day, input_name)
+    data = funcs["parse"](input_file)
+    profiles = {}
+    for phase in phases:
+        if funcs[phase] is None:
+            continue
+        arg = input_file if phase == "parse" else data
+        profiles[phase] = profile_phase(funcs[phase], arg, top, sample)
+    return profiles
+
+
+def main(args) -> None:
+    """Entry point of the profile command.
+
+    Writes a text report, a pstats dump for tools such as snakeviz and,
+    with --flamegraph, a collapsed stack file for each profiled phase.
+
+    Args:
+        args (argparse.Namespace): Command line arguments.
+    """
+    from advent.runner import parse_days
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    phases = tuple(args.phases.split(",")) if args.phases else PHASES
+    for day in parse_days(args.days):
+        profiles = profile_day(day, args.input, phases, args.top, args.flamegraph)
+        for phase, profile in profiles.items():
+            name = f"{day_name(day)}_{phase}"
+            report = format_profile(day, phase, profile)
+            print(report + "\n")
+            (output_dir / f"{name}.txt").write_text(report + "\n")
+            profile["stats"].dump_stats(output_dir / f"{name}.prof")
+            if profile["collapsed"] is not None:
+                (output_dir / f"{name}.collapsed").write_text(
+                    profile["collapsed"] + "\n"
+                )
+    print(f"Wrote profiles to {output_dir}")
+
+
+# Tests
+
+
+def _busy(n: int) -> int:
+    total = 0
+    for _ in range(50):
+        total += sum(i * i for i in range(n))
+    return total
+
+
+def test_stack_sampler():
+    sampler = StackSampler()
+    assert sampler.run(_busy, 20_000) == _busy(20_000)
+    assert sampler.stacks
+    stack, count = sampler.collapsed().splitlines()[0].rsplit(" ", 1)
+    assert stack.startswith("profiling:_busy")
+    assert int(count) > 0
+
+
+def _temporary(n: int) -> int:
+    strings = [str(i) for i in range(n)]
+    time.sleep(0.05)
+    return len(strings)
+
+
+def test_peak_snapshot():
+    peak = PeakSnapshot()
+    assert peak.run(_temporary, 200_000) == 200_000
+    allocation = peak.allocations(1)[0]
+    assert allocation["line"].endswith(
+        f"profiling.py:{_temporary.__code__.co_firstlineno + 1}"
+    )
+    assert allocation["kb"] > 1_000
+    assert peak.peak / 2 ** 10 >= allocation["kb"]
+
+
+def test_profile_day():
+    profiles = profile_day(18, "example.txt", top=5, sample=True)
+    assert set(profiles) == {"parse", "part_1", "part_2"}
+    part_1 = profiles["part_1"]
+    assert "get_explode" in part_1["hot_functions"]
+    assert "cumulative time" in part_1["hot_functions"]
+    assert part_1["peak_mb"] > 0
+    assert part_1["allocations"][0]["count"] > 0
+    assert "Hot functions:" in format_profile(18, "part_1", part_1)
@@ -0,0 +1,322 @@
+import copy
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from advent.cache import AnswerCache, ParseCache
+from advent.days import PHASES, get_phases, input_path
+
+
+def parse_days(days: str) -> list:
+    """Parse a days selection such as "1-25" or "1,3,5-7".
+
+    Args:
+        days (str): Days selection.
+
+    Returns:
+        list: Sorted day numbers.
+    """
+    selected = set()
+    for part in days.split(","):
+        part = part.strip()
+        if "-" in part:
+            start, end = part.split("-")
+            selected.update(range(int(start), int(end) + 1))
+        elif part:
+            selected.add(int(part))
+    return sorted(selected)
+
+
+def run_day(
+    day: int,
+    input_name: str = "input.txt",
+    parse_cache: str = None,
+    answer_cache: str = None,
+    force: bool = False,
+    parts: list = None,
+) -> dict:
+    """Parse and solve a day, timing each phase.
+
+    Each part is given its own copy of the parsed input, as several
+    solutions modify their input while solving. Parts with a cached answer
+    are not solved again, and the input isn't parsed if every part is cached.
+
+    Args:
+        day (int): Day number.
+        input_name (str, optional): Input file within the day's folder.
+        Defaults to "input.txt".
+        parse_cache (str, optional): Folder of the parse cache. Defaults to
+        None, which parses without a cache.
+        answer_cache (str, optional): Folder of the answer cache. Defaults
+        to None, which solves every part.
+        force (bool, optional): Solve every part and refresh the answer
+        cache. Defaults to False.
+        parts (list, optional): Parts to solve, i.e. ["part_1"]. Defaults
+        to every solved part.
+
+    Returns:
+        dict: Day, answers, timings (in seconds) of each phase that ran and
+        the parts answered from the cache. Phases that aren't solved are
+        left out.
+    """
+    result = {"day": day, "answers": {}, "timings": {}, "cached": [], "error": None}
+    try:
+        phases = get_phases(day)
+        if phases["parse"] is None:
+            return result
+
+        input_file = input_path(day, input_name)
+        parts = [
+            phase
+            for phase in PHASES[1:]
+            if phases[phase] is not None and (parts is None or phase in parts)
+        ]
+        answers = {}
+        keys = {}
+        if answer_cache:
+            cache = AnswerCache(answer_cache)
+            for phase in parts:
+                keys[phase] = cache.key(day, phase, input_file)
+                hit, answer = (False, None) if force else cache.get(keys[phase])
+                if hit:
+                    answers[phase] = answer
+                    result["cached"].append(phase)
+
+        unsolved = [phase for phase in parts if phase not in answers]
+        if unsolved:
+            start = time.perf_counter()
+            if parse_cache:
+                data = ParseCache(parse_cache).parse(day, phases["parse"], input_file)
+            else:
+                data = phases["parse"](input_file)
+            result["timings"]["parse"] = time.perf_counter() - start
+
+        for phase in unsolved:
+            phase_data = copy.deepcopy(data)
+            start = time.perf_counter()
+            answers[phase] = phases[phase](phase_data)
+            result["timings"][phase] = time.perf_counter() - start
+            if answer_cache:
+                cache.put(keys[phase], answers[phase])
+        result["answers"] = {phase: answers[phase] for phase in parts}
+    except Exception:
+        result["error"] = traceback.format_exc()
+    return result
+
+
+def schedule(days: list, previous_report: str = None) -> list:
+    """Order days so the slowest start first.
+
+    Uses the timings of a previous report when there is one, which keeps
+    the total wall time close to the time of the slowest day.
+
+    Args:
+        days (list): Days to run.
+        previous_report (str, optional): Previous JSON report. Defaults to None.
+
+    Returns:
+        list: Days in the order to submit them.
+    """
+    if not previous_report or not os.path.exists(previous_report):
+        return list(days)
+    with open(previous_report) as f:
+        report = json.load(f)
+    totals = {r["day"]: sum(r["timings"].values()) for r in report["days"]}
+    return sorted(days, key=lambda day: totals.get(day, float("inf")), reverse=True)
+
+
+def run(
+    days: list,
+    jobs: int = None,
+    input_name: str = "input.txt",
+    order: list = None,
+    parse_cache: str = None,
+    answer_cache: str = None,
+    force: bool = False,
+) -> list:
+    """Run several days over a process pool.
+
+    Args:
+        days (list): Days to run.
+        jobs (int, optional): Number of worker processes. Defaults to the
+        number of CPUs.
+        input_name (str, optional): Input file within each day's folder.
+        Defaults to "input.txt".
+        order (list, optional): Order to submit the days in. Defaults to days.
+        parse_cache (str, optional): Folder of the parse cache. Defaults to None.
+        answer_cache (str, optional): Folder of the answer cache. Defaults to None.
+        force (bool, optional): Ignore cached answers. Defaults to False.
+
+    Returns:
+        list: Result of each day, sorted by day.
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(run_day, day, input_name, parse_cache, answer_cache, force)
+            for day in order or days
+        ]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return sorted(results, key=lambda r: r["day"])
+
+
+def format_report(results: list, wall_time: float) -> str:
+    """Format results as a table of answers and phase timings.
+
+    Args:
+        results (list): Results from run.
+        wall_time (float): Wall time of the whole run in seconds.
+
+    Returns:
+        str: Printable table.
+    """
+    header = (
+        f"{'Day':>3}  {'parse':>9}  {'part_1':>9}  {'part_2':>9}  {'total':>9}  Answers"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        timings = result["timings"]
+        cells = []
+        for phase in PHASES:
+            if phase in timings:
+                cells.append(f"{timings[phase] * 1000:>7.1f}ms")
+            elif phase in result.get("cached", ()):
+                cells.append(f"{'cached':>9}")
+            else:
+                cells.append(f"{'-':>9}")
+        total = sum(timings.values()) * 1000
+        if result["error"]:
+            answers = "error: " + result["error"].strip().splitlines()[-1]
+        else:
+            answers = ", ".join(str(a).strip() for a in result["answers"].values())
+            answers = answers.replace("\n", " | ")
+        lines.append(
+            f"{result['day']:>3}  {'  '.join(cells)}  {total:>7.1f}ms  {answers}"
+        )
+    slowest = max(results, key=lambda r: sum(r["timings"].values()))
+    lines.append("-" * len(header))
+    lines.append(
+        f"Wall time: {wall_time:.3f}s "
+        f"(slowest: day {slowest['day']}, {sum(slowest['timings'].values()):.3f}s)"
+    )
+    return "\n".join(lines)
+
+
+def write_report(results: list, wall_time: float, report_file: str, jobs: int) -> None:
+    """Write results to a JSON report.
+
+    Args:
+        results (list): Results from run.
+        wall_time (float): Wall time of the whole run in seconds.
+        report_file (str): JSON file to write.
+        jobs (int): Number of worker processes used.
+    """
+    report = {"wall_time": wall_time, "jobs": jobs, "days": results}
+    Path(report_file).write_text(json.dumps(report, indent=2, default=str))
+
+
+def main(args) -> None:
+    """Entry point of the run command.
+
+    Args:
+        args (argparse.Namespace): Command line arguments.
+    """
+    days = parse_days(args.days)
+    jobs = args.jobs or os.cpu_count()
+    order = schedule(days, args.report)
+
+    start = time.perf_counter()
+    results = run(
+        days, jobs, args.input, order, args.parse_cache, args.answer_cache, args.force
+    )
+    wall_time = time.perf_counter() - start
+
+    print(format_report(results, wall_time))
+    if args.report:
+        write_report(results, wall_time, args.report, jobs)
+
+
+# Tests
+
+
+def test_parse_days():
+    assert parse_days("1-3") == [1, 2, 3]
+    assert parse_days("1,3,5-7") == [1, 3, 5, 6, 7]
+    assert parse_days("25") == [25]
+
+
+def test_run_day():
+    result = run_day(1, "example.txt")
+    assert result["error"] is None
+    assert result["answers"] == {"part_1": 7, "part_2": 5}
+    assert set(result["timings"]) == {"parse", "part_1", "part_2"}
+
+
+def test_run_day_copies_input():
+    result = run_day(11, "example.txt")
+    assert result["answers"] == {"part_1": 1656, "part_2": 195}
+
+
+def test_run_day_unsolved():
+    result = run_day(24, "example.txt")
+    assert result["answers"] == {}
+    assert result["timings"] == {}
+
+
+def test_run_day_error():
+    result = run_day(1, "missing.txt")
+    assert "FileNotFoundError" in result["error"]
+
+
+def test_run_day_parse_cache(tmp_path):
+    first = run_day(19, "example.txt", parse_cache=tmp_path)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+    second = run_day(19, "example.txt", parse_cache=tmp_path)
+    assert second["error"] is None
+    assert second["answers"] == first["answers"]
+
+
+def test_run_day_answer_cache(tmp_path):
+    first = run_day(6, "example.txt", answer_cache=tmp_path)
+    assert first["cached"] == []
+    second = run_day(6, "example.txt", answer_cache=tmp_path)
+    assert second["cached"] == ["part_1", "part_2"]
+    assert (
+        second["answers"] == first["answers"] == {"part_1": 5934, "part_2": 26984457539}
+    )
+    assert second["timings"] == {}
+    forced = run_day(6, "example.txt", answer_cache=tmp_path, force=True)
+    assert forced["cached"] == []
+    assert set(forced["timings"]) == {"parse", "part_1", "part_2"}
+
+
+def test_run():
+    results = run([1, 2], jobs=2, input_name="example.txt")
+    assert [r["day"] for r in results] == [1, 2]
+    assert results[1]["answers"] == {"part_1": 150, "part_2": 900}
+
+
+def test_schedule(tmp_path):
+    report_file = tmp_path / "report.json"
+    results = [
+        {
+            "day": 1,
+            "answers": {},
+            "timings": {"parse": 0.1},
+            "cached": [],
+            "error": None,
+        },
+        {
+            "day": 2,
+            "answers": {},
+            "timings": {"parse": 0.5},
+            "cached": [],
+            "error": None,
+        },
+    ]
+    write_report(results, 0.5, report_file, 2)
+    assert schedule([1, 2, 3], report_file) == [3, 2, 1]
@@ -0,0 +1,155 @@
+# pytest puts the folder of this conftest on sys.path, which lets the day
+# modules import the shared helpers in utils.
+#
+# It also enforces the time and memory budgets of tests marked with
+# utils.budget.budget or @pytest.mark.budget(seconds=..., mb=...).
+import os
+import resource
+import threading
+import time
+
+import pytest
+
+
+class PeakMemory:
+    """Tracks how far the resident memory of the process grows.
+
+    On Linux a thread samples /proc/self/statm, elsewhere the growth of
+    the process' maximum resident size is used instead.
+    """
+
+    INTERVAL = 0.002
+
+    def __init__(self) -> None:
+        self._stop = threading.Event()
+        self._thread = None
+        self.peak = 0
+
+    @staticmethod
+    def _rss() -> int:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    def _sample(self, start: int) -> None:
+        while not self._stop.wait(self.INTERVAL):
+            self.peak = max(self.peak, self._rss() - start)
+
+    def __enter__(self):
+        if os.path.exists("/proc/self/statm"):
+            self._thread = threading.Thread(target=self._sample, args=(self._rss(),))
+            self._thread.start()
+        else:
+            self._start_max = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        else:
+            # ru_maxrss is in KB on Linux and bytes on macOS.
+            scale = 1 if os.uname().sysname == "Darwin" else 1024
+            grown = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - self._start_max
+            self.peak = grown * scale
+
+    @property
+    def mb(self) -> float:
+        return self.peak / 2 ** 20
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply the time and memory budgets of tests, i.e. 2 on a slow machine.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "budget(seconds=None, mb=None, size=None, seed=0): fail the test when it runs "
+        "longer than seconds or grows resident memory by more than mb.",
+    )
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        budget = getattr(getattr(item, "obj", None), "budget", None)
+        if isinstance(budget, dict) and item.get_closest_marker("budget") is None:
+            item.add_marker(pytest.mark.budget(**budget))
+
+
+@pytest.fixture(scope="session")
+def _large_inputs(tmp_path_factory):
+    return tmp_path_factory.mktemp("large_inputs")
+
+
+@pytest.fixture
+def large_input(request, _large_inputs):
+    """Path of a generated input for the day of the test, sized by its budget.
+
+    Skips the test while the day's generate_input isn't written yet.
+    """
+    from advent.bench import benchmark_config
+    from advent.generators import write_input
+
+    day = int(request.module.__name__.rpartition("day")[2])
+    marker = request.node.get_closest_marker("budget")
+    options = marker.kwargs if marker else {}
+    size = options.get("size") or benchmark_config(day)["sizes"][-1]
+    seed = options.get("seed", 0)
+    path = _large_inputs / f"day{day:02}_{size}_{seed}.txt"
+    if not path.exists():
+        try:
+            write_input(day, path, size, seed)
+        except NotImplementedError:
+            pytest.skip(f"day {day} has no input generator yet")
+    return str(path)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    marker = pyfuncitem.get_closest_marker("budget")
+    if marker is None:
+        return None
+
+    scale = pyfuncitem.config.getoption("budget_scale")
+    seconds = marker.kwargs.get("seconds")
+    mb = marker.kwargs.get("mb")
+    testargs = {
+        arg: pyfuncitem.funcargs[arg] for arg in pyfuncitem._fixtureinfo.argnames
+    }
+    with PeakMemory() as memory:
+        start = time.perf_counter()
+        pyfuncitem.obj(**testargs)
+        elapsed = time.perf_counter() - start
+
+    over = []
+    if seconds is not None and elapsed > seconds * scale:
+        over.append(f"took {elapsed:.3f}s, budget {seconds * scale:.3f}s")
+    if mb is not None and memory.mb > mb * scale:
+        over.append(f"grew memory by {memory.mb:.1f}MB, budget {mb * scale:.1f}MB")
+    pyfuncitem.user_properties.append(("budget", (elapsed, seconds, memory.mb, mb)))
+    if over:
+        pytest.fail(f"Over budget: {'; '.join(over)}", pytrace=False)
+    return True
+
+
+def pytest_terminal_summary(terminalreporter):
+    rows = []
+    for outcome in ("passed", "failed"):
+        for report in terminalreporter.stats.get(outcome, []):
+            for name, value in getattr(report, "user_properties", ()):
+                if name == "budget" and report.when == "call":
+                    rows.append((report.nodeid, *value))
+    if not rows:
+        return
+    terminalreporter.section("budgets")
+    for nodeid, elapsed, seconds, mb_used, mb in rows:
+        seconds = "-" if seconds is None else f"{seconds:.2f}s"
+        mb = "-" if mb is None else f"{mb:.0f}MB"
+        terminalreporter.write_line(
+            f"{elapsed:>8.3f}s of {seconds:>7}  {mb_used:>7.1f}MB of {mb:>6}  {nodeid}"
+        )
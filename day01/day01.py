@@ -1,3 +1,18 @@
+import io
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import gt
+from typing import Iterable, Iterator
+
+from utils.reader import line_ranges, read_ints, read_line_blocks
+
+# Bytes each worker parses at a time, bounding its memory on huge logs.
+BLOCK_BYTES = 2 ** 23
+
+
 def parse_input(input_file: str = "day1/input.txt") -> list:
     """Parse the txt puzzle input into a list of ints.
 
@@ -7,9 +22,7 @@ def parse_input(input_file: str = "day1/input.txt") -> list:
     Returns:
         list: Puzzle input as a list of ints.
     """
-    o = open(input_file)
-    output = [int(i.strip()) for i in o.readlines()]
-    return output
+    return list(read_ints(input_file))
 
 
 def part_1(depth_measurements: list) -> int:
@@ -34,6 +47,10 @@ def part_2(depth_measurements: list, sliding_window: int = 3) -> int:
     """Count the number of times the depth measurement increases
     when constrained by a sliding window.
 
+    Consecutive windows share all but their first and last measurement, so
+    a window is larger than the one before it exactly when the measurement
+    it gains is larger than the one it drops. This is O(n) for any window.
+
     Args:
         depth_measurements (list): Puzzle input.
         sliding_window (int, optional): Sliding window to consider. Defaults to 3.
@@ -41,14 +58,185 @@ def part_2(depth_measurements: list, sliding_window: int = 3) -> int:
     Returns:
         int: Number of depth increases.
     """
-    current_window = sum(depth_measurements[0:sliding_window])
-    depth_increases = 0
-    for i in range(len(depth_measurements) - sliding_window + 1):
-        window = sum(depth_measurements[i : i + sliding_window])
-        if window > current_window:
-            depth_increases += 1
-        current_window = window
-    return depth_increases
+    gained = islice(depth_measurements, sliding_window, None)
+    return sum(map(gt, gained, depth_measurements))
+
+
+def stream_increases(readings: Iterable, sliding_window: int = 3) -> Iterator[int]:
+    """Count depth increases over a stream of readings as they arrive.
+
+    Only the last sliding_window readings are kept, so memory stays O(w)
+    however long the stream is. Readings can be ints or lines of text, so a
+    file object such as sys.stdin can be passed as is; blank lines are skipped.
+
+    Args:
+        readings (Iterable): Depth readings.
+        sliding_window (int, optional): Sliding window to consider. Defaults to 3.
+
+    Yields:
+        int: Number of depth increases so far, after each reading.
+    """
+    window = deque(maxlen=sliding_window)
+    increases = 0
+    for reading in readings:
+        if not isinstance(reading, int):
+            reading = reading.strip()
+            if not reading:
+                continue
+            reading = int(reading)
+        if len(window) == sliding_window and reading > window[0]:
+            increases += 1
+        window.append(reading)
+        yield increases
+
+
+def _bit_planes(depth_measurements: list) -> list:
+    """Store the readings as bit planes for bit-parallel comparisons.
+
+    Bit i of plane b is bit b of reading i, less the smallest reading.
+
+    Args:
+        depth_measurements (list): Puzzle input.
+
+    Returns:
+        list: One int per bit of the readings, most significant first.
+    """
+    low = min(depth_measurements, default=0)
+    shifted = [reading - low for reading in depth_measurements]
+    bits = max(shifted, default=0).bit_length()
+    planes = []
+    for b in reversed(range(bits)):
+        digits = "".join(
+            "1" if reading >> b & 1 else "0" for reading in reversed(shifted)
+        )
+        planes.append(int(digits or "0", 2))
+    return planes
+
+
+def sweep_windows(depth_measurements: list, windows: Iterable) -> dict:
+    """Count depth increases for many sliding windows at once.
+
+    As in part_2, window w counts readings larger than the one w places
+    before. The readings are stored once as bit planes, then for each window
+    every comparison is done together with a few big int operations per bit,
+    comparing the planes to themselves shifted by w.
+
+    Args:
+        depth_measurements (list): Puzzle input.
+        windows (Iterable): Sliding windows to consider, i.e. range(1, 1001).
+
+    Returns:
+        dict: Number of depth increases of each window.
+    """
+    planes = _bit_planes(depth_measurements)
+    n = len(depth_measurements)
+    counts = {}
+    for window in windows:
+        # Compare reading i + window (later) with reading i (earlier) for
+        # every i at once, from the most significant bit down.
+        greater = 0
+        equal = (1 << max(n - window, 0)) - 1
+        for plane in planes:
+            later = plane >> window
+            greater |= equal & later & ~plane
+            equal &= ~(later ^ plane)
+        counts[window] = greater.bit_count()
+    return counts
+
+
+def _summarise(readings: list, sliding_window: int) -> tuple:
+    """Summarise a run of readings for stitching to its neighbours.
+
+    Args:
+        readings (list): Consecutive depth readings.
+        sliding_window (int): Sliding window to consider.
+
+    Returns:
+        tuple: Increases within the run, its first and its last
+        sliding_window readings.
+    """
+    increases = sum(map(gt, islice(readings, sliding_window, None), readings))
+    return increases, readings[:sliding_window], readings[-sliding_window:]
+
+
+def _stitch(first: tuple, second: tuple, sliding_window: int) -> tuple:
+    """Combine the summaries of two consecutive runs of readings.
+
+    Adds the increases of the windows that span both runs, which only
+    involve the end of the first run and the start of the second.
+
+    Args:
+        first (tuple): Summary of the earlier run.
+        second (tuple): Summary of the later run.
+        sliding_window (int): Sliding window to consider.
+
+    Returns:
+        tuple: Summary of both runs together.
+    """
+    increases_1, head_1, tail_1 = first
+    increases_2, head_2, tail_2 = second
+    joined = tail_1 + head_2
+    spanning = sum(
+        joined[i + sliding_window] > joined[i]
+        for i in range(len(tail_1))
+        if i + sliding_window < len(joined)
+    )
+    return (
+        increases_1 + increases_2 + spanning,
+        (head_1 + head_2)[:sliding_window],
+        (tail_1 + tail_2)[-sliding_window:],
+    )
+
+
+def _count_range(input_file: str, start: int, end: int, sliding_window: int) -> tuple:
+    """Summarise the readings in a byte range of a file.
+
+    Args:
+        input_file (str): Puzzle input txt file.
+        start (int): Offset of the first byte, at the start of a line.
+        end (int): Offset past the last byte, at the end of a line.
+        sliding_window (int): Sliding window to consider.
+
+    Returns:
+        tuple: Summary of the range, see _summarise.
+    """
+    summary = (0, [], [])
+    for block in read_line_blocks(input_file, start, end, BLOCK_BYTES):
+        readings = list(map(int, block.split()))
+        summary = _stitch(summary, _summarise(readings, sliding_window), sliding_window)
+    return summary
+
+
+def parallel_increases(
+    input_file: str, sliding_window: int = 3, jobs: int = None, parts: int = None
+) -> int:
+    """Count depth increases of a large file over a process pool.
+
+    The file is split into byte ranges on line breaks. Each worker counts
+    the increases within its range, and the windows spanning two ranges are
+    added when the results are stitched back together.
+
+    Args:
+        input_file (str): Puzzle input txt file.
+        sliding_window (int, optional): Sliding window to consider. Defaults to 3.
+        jobs (int, optional): Worker processes. Defaults to the CPU count.
+        parts (int, optional): Byte ranges to split the file into. Defaults
+        to jobs.
+
+    Returns:
+        int: Number of depth increases, the same as part_2.
+    """
+    jobs = jobs or os.cpu_count()
+    ranges = line_ranges(input_file, parts or jobs)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(_count_range, input_file, start, end, sliding_window)
+            for start, end in ranges
+        ]
+        summary = (0, [], [])
+        for future in futures:
+            summary = _stitch(summary, future.result(), sliding_window)
+    return summary[0]
 
 
 # Tests
@@ -72,6 +260,52 @@ def test_part_2():
     assert answer == 5
 
 
+def test_part_2_windows():
+    rng = random.Random(1)
+    depths = [rng.randrange(1_000) for _ in range(2_000)]
+    for window in (1, 2, 3, 50, 1_999, 2_000, 5_000):
+        sums = [sum(depths[i : i + window]) for i in range(len(depths) - window + 1)]
+        expected = sum(b > a for a, b in zip(sums, sums[1:]))
+        assert part_2(depths, window) == expected
+    assert part_2(depths, 1) == part_1(depths)
+
+
+def test_stream_increases():
+    output = parse_input("day01/example.txt")
+    assert list(stream_increases(output, 1)) == [0, 1, 2, 3, 3, 4, 5, 6, 6, 7]
+    assert deque(stream_increases(output), maxlen=1)[0] == part_2(output)
+    lines = io.StringIO("\n".join(map(str, output)) + "\n\n")
+    assert list(stream_increases(lines)) == list(stream_increases(output))
+    assert list(stream_increases(iter(b"1\n5\n2\n".splitlines()), 2)) == [0, 0, 1]
+
+
+def test_sweep_windows():
+    output = parse_input("day01/input.txt")
+    windows = [1, 2, 3, 7, 100, len(output) - 1, len(output), len(output) + 5]
+    counts = sweep_windows(output, windows)
+    assert counts == {window: part_2(output, window) for window in windows}
+    assert sweep_windows([-3, -5, 2, 2], range(1, 4)) == {1: 1, 2: 2, 3: 1}
+    assert sweep_windows([], [1]) == {1: 0}
+
+
+def test_parallel_increases():
+    output = parse_input("day01/input.txt")
+    for window in (1, 3, 500):
+        expected = part_2(output, window)
+        assert (
+            parallel_increases("day01/input.txt", window, jobs=2, parts=7) == expected
+        )
+    # More ranges than lines, so windows span several ranges.
+    assert parallel_increases("day01/example.txt", 3, jobs=2, parts=40) == 5
+
+
+def test_count_range_blocks(monkeypatch):
+    monkeypatch.setattr(f"{__name__}.BLOCK_BYTES", 16)
+    output = parse_input("day01/input.txt")
+    size = os.path.getsize("day01/input.txt")
+    assert _count_range("day01/input.txt", 0, size, 4)[0] == part_2(output, 4)
+
+
 if __name__ == "__main__":
     output = parse_input("day01/input.txt")
     answer_1 = part_1(output)
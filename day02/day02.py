@@ -1,3 +1,29 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import accumulate
+from operator import mul
+
+from utils.reader import DIGITS, line_ranges, mapped, read_line_blocks
+
+# Bytes each worker parses at a time, bounding its memory on huge logs.
+BLOCK_BYTES = 2 ** 23
+
+# How far each command moves forward and down, per unit of its value.
+FORWARD = {b"forward": 1, b"down": 0, b"up": 0}
+DOWN = {b"forward": 0, b"down": 1, b"up": -1}
+
+# Single letter codes of the directions, and byte tables keeping the cells
+# of one direction, for parsing commands with single digit values.
+LETTERS = ((b"forward ", b"F"), (b"down ", b"D"), (b"up ", b"U"))
+KEEP = {
+    letter: bytes(0xFF if byte == letter[0] else 0 for byte in range(256))
+    for _, letter in LETTERS
+}
+NEGATE = bytes(-byte % 256 for byte in range(256))
+
+
 def command_to_xy(command: str) -> tuple:
     """Convert a command to x, y coordinates.
 
@@ -17,60 +43,316 @@ def command_to_xy(command: str) -> tuple:
         return (0, -value)
 
 
-def parse_input(input_file: str) -> list:
+def _parse_single_digits(data: bytes) -> tuple:
+    """Parse commands whose values are all single digits.
+
+    Each command is shortened to a letter, a digit and a line break, so the
+    letters and digits are every third byte. The columns are then built
+    with byte tables and big int masks, all running in C.
+
+    Args:
+        data (bytes): Commands.
+
+    Returns:
+        tuple: x and y columns, or None if a value has several digits or
+        a line isn't a command.
+    """
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    lines = data.count(b"\n")
+    if sum(data.count(word) for word, _ in LETTERS) != lines:
+        return None
+    for word, letter in LETTERS:
+        data = data.replace(word, letter)
+    if len(data) != 3 * lines or data[2::3] != b"\n" * lines:
+        return None
+
+    letters = data[0::3]
+    digits = data[1::3]
+    if letters.translate(None, b"FDU") or digits.translate(None, b"0123456789"):
+        return None
+    digits = digits.translate(DIGITS)
+    values = int.from_bytes(digits, "little")
+    negated = int.from_bytes(digits.translate(NEGATE), "little")
+
+    def keep(cells: int, letter: bytes) -> int:
+        return cells & int.from_bytes(letters.translate(KEEP[letter]), "little")
+
+    x = array("B")
+    x.frombytes(keep(values, b"F").to_bytes(lines, "little"))
+    y = array("b")
+    y.frombytes((keep(values, b"D") | keep(negated, b"U")).to_bytes(lines, "little"))
+    return x, y
+
+
+def parse_commands(data: bytes) -> tuple:
+    """Parse commands in bulk into x and y columns.
+
+    Inputs with single digit values take a byte level fast path. Others
+    are split once, then each column is built by mapping over every command
+    at once, without a Python loop per line.
+
+    Args:
+        data (bytes): Commands, i.e. b"forward 5\ndown 5".
+
+    Returns:
+        tuple: Arrays of the x and y movement of each command, as
+        command_to_xy would give them.
+
+    Raises:
+        ValueError: If a command has an unknown direction or a value that
+        isn't a number.
+    """
+    columns = _parse_single_digits(data)
+    if columns is not None:
+        return columns
+    tokens = data.split()
+    directions = tokens[0::2]
+    values = list(map(int, tokens[1::2]))
+    try:
+        x = array("q", map(mul, values, map(FORWARD.__getitem__, directions)))
+        y = array("q", map(mul, values, map(DOWN.__getitem__, directions)))
+    except KeyError as error:
+        raise ValueError(f"Unknown direction: {error.args[0].decode()!r}") from None
+    return x, y
+
+
+def parse_input(input_file: str) -> tuple:
     """Parse the txt puzzle input.
 
     Args:
         input_file (str): Puzzle imput txt file.
 
     Returns:
-        list: Parsed puzzle input.
+        tuple: Arrays of the x and y movement of each command.
     """
-    o = open(input_file)
-    output = [command_to_xy(i.strip()) for i in o.readlines()]
-    return output
+    with mapped(input_file) as mm:
+        return parse_commands(mm[:])
 
 
-def part_1(commands: list) -> int:
+def part_1(commands: tuple) -> int:
     """Solve part 1.
 
     Args:
-        commands (list): List of commands. Puzzle input.
+        commands (tuple): x and y columns of the commands. Puzzle input.
 
     Returns:
         int: Horizontal position multiplied by the depth.
     """
-    x_pos = sum([x for x, _ in commands])
-    y_pos = sum([y for _, y in commands])
-    return x_pos * y_pos
+    x, y = commands
+    return sum(x) * sum(y)
 
 
-def part_2(commands: list) -> int:
+def part_2(commands: tuple) -> int:
     """Solve part 2. Accounts for aim.
 
+    The aim after each command is the running sum of the y column, and each
+    forward move goes down by x times that aim.
+
     Args:
-        commands (list): List of commands. Puzzle input.
+        commands (tuple): x and y columns of the commands. Puzzle input.
 
     Returns:
         int: Horizontal position multiplied by the depth.
     """
-    aim = 0
-    x_pos = 0
-    y_pos = 0
-    for i in commands:
-        x_pos += i[0]
-        aim += i[1]
-        y_pos += i[0] * aim
-    return x_pos * y_pos
+    x, y = commands
+    return sum(x) * sum(map(mul, x, accumulate(y)))
+
+
+def summarise(commands: tuple) -> tuple:
+    """Summarise a run of commands by its effect from zero aim.
+
+    Args:
+        commands (tuple): x and y columns of the commands.
+
+    Returns:
+        tuple: Change in horizontal position, aim and depth, the depth
+        change being from a starting aim of zero.
+    """
+    x, y = commands
+    return sum(x), sum(y), sum(map(mul, x, accumulate(y)))
+
+
+def combine(first: tuple, second: tuple) -> tuple:
+    """Combine the summaries of two consecutive runs of commands.
+
+    The second run starts with the aim the first one left, which adds that
+    aim times its forward moves to its depth change. The operator is
+    associative, so runs can be summarised apart and combined in order.
+
+    Args:
+        first (tuple): Summary of the earlier run.
+        second (tuple): Summary of the later run.
+
+    Returns:
+        tuple: Summary of both runs together.
+    """
+    x_1, aim_1, depth_1 = first
+    x_2, aim_2, depth_2 = second
+    return x_1 + x_2, aim_1 + aim_2, depth_1 + depth_2 + aim_1 * x_2
+
+
+class Tracker:
+    def __init__(self, state: tuple = (0, 0, 0)) -> None:
+        """Track the submarine as commands arrive.
+
+        The state is the summary of every command so far, see summarise, so
+        each query is O(1) and a snapshot is a tuple of three ints.
+
+        Args:
+            state (tuple, optional): Horizontal position, aim and depth to
+            start from. Defaults to the surface.
+        """
+        self.state = state
+
+    @property
+    def horizontal(self) -> int:
+        """Horizontal position."""
+        return self.state[0]
+
+    @property
+    def aim(self) -> int:
+        """Aim, which is also the depth when aim is ignored as in part 1."""
+        return self.state[1]
+
+    @property
+    def depth(self) -> int:
+        """Depth, accounting for aim as in part 2."""
+        return self.state[2]
+
+    def command(self, command) -> None:
+        """Apply one command.
+
+        Args:
+            command (str | tuple): Command, i.e. "forward 5", or its x, y
+            movement from command_to_xy.
+
+        Raises:
+            ValueError: If the command has an unknown direction.
+        """
+        if isinstance(command, (str, bytes)):
+            text = command.decode() if isinstance(command, bytes) else command
+            command = command_to_xy(text)
+            if command is None:
+                raise ValueError(f"Unknown command: {text!r}")
+        x, y = command
+        horizontal, aim, depth = self.state
+        self.state = horizontal + x, aim + y, depth + aim * x
+
+    def commands(self, commands) -> None:
+        """Apply a batch of commands.
+
+        Args:
+            commands (bytes | str | tuple): Lines of commands, or x and y
+            columns as parse_input returns them.
+        """
+        if isinstance(commands, str):
+            commands = commands.encode()
+        if isinstance(commands, bytes):
+            commands = parse_commands(commands)
+        self.state = combine(self.state, summarise(commands))
+
+    def snapshot(self) -> tuple:
+        """Current state, to rewind to later."""
+        return self.state
+
+    def rewind(self, snapshot: tuple) -> None:
+        """Go back to a snapshot."""
+        self.state = snapshot
+
+    def part_1(self) -> int:
+        """Answer of part 1 for the commands so far.
+
+        Returns:
+            int: Horizontal position multiplied by the depth, ignoring aim.
+        """
+        return self.horizontal * self.aim
+
+    def part_2(self) -> int:
+        """Answer of part 2 for the commands so far.
+
+        Returns:
+            int: Horizontal position multiplied by the depth.
+        """
+        return self.horizontal * self.depth
+
+
+def _summarise_range(input_file: str, start: int, end: int) -> tuple:
+    """Summarise the commands in a byte range of a file.
+
+    Args:
+        input_file (str): Puzzle input txt file.
+        start (int): Offset of the first byte, at the start of a line.
+        end (int): Offset past the last byte, at the end of a line.
+
+    Returns:
+        tuple: Summary of the range, see summarise.
+    """
+    blocks = read_line_blocks(input_file, start, end, BLOCK_BYTES)
+    summaries = (summarise(parse_commands(block)) for block in blocks)
+    return reduce(combine, summaries, (0, 0, 0))
+
+
+def parallel_part_2(input_file: str, jobs: int = None, parts: int = None) -> int:
+    """Solve part 2 of a large file over a process pool.
+
+    The file is split into byte ranges on line breaks, each summarised by
+    a worker, then the summaries are combined in order.
+
+    Args:
+        input_file (str): Puzzle input txt file.
+        jobs (int, optional): Worker processes. Defaults to the CPU count.
+        parts (int, optional): Byte ranges to split the file into. Defaults
+        to jobs.
+
+    Returns:
+        int: Horizontal position multiplied by the depth, the same as part_2.
+    """
+    jobs = jobs or os.cpu_count()
+    ranges = line_ranges(input_file, parts or jobs)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_summarise_range, input_file, *r) for r in ranges]
+        x, _, depth = reduce(combine, (f.result() for f in futures), (0, 0, 0))
+    return x * depth
 
 
 # Tests
 
 
 def test_parse_input():
-    output = parse_input("day02/example.txt")
-    assert type(output) is list
-    assert all(type(i) is tuple for i in output)
+    x, y = parse_input("day02/example.txt")
+    assert list(x) == [5, 0, 8, 0, 0, 2]
+    assert list(y) == [0, 5, 0, -3, 8, 0]
+
+
+def test_parse_commands():
+    lines = ["forward 12", "down 3", "up 40", "forward 1"]
+    x, y = parse_commands("\n".join(lines).encode() + b"\n")
+    assert list(zip(x, y)) == [command_to_xy(line) for line in lines]
+    assert parse_commands(b"") == (array("q"), array("q"))
+    x, y = parse_commands(b"forward 10\nup 3\ndown 10\nforward 2\n\n")
+    assert (list(x), list(y)) == ([10, 0, 0, 2], [0, -3, 10, 0])
+    try:
+        parse_commands(b"forward 5\ndown x\n")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("parsed a command without a number")
+
+
+def test_parse_single_digits():
+    data = b"forward 5\ndown 5\nforward 8\nup 3\ndown 8\nforward 2"
+    x, y = _parse_single_digits(data)
+    assert (x.typecode, y.typecode) == ("B", "b")
+    assert list(zip(x, y)) == [
+        command_to_xy(line) for line in data.decode().splitlines()
+    ]
+    assert _parse_single_digits(data + b"\nup 10") is None
+    assert _parse_single_digits(data.replace(b"\n", b"\r\n")) is None
+    assert _parse_single_digits(b"forward 10\nup 3\ndown 10\nforward 2\n\n") is None
+    assert _parse_single_digits(b"forward 1\nleft 2\n") is None
+    assert _parse_single_digits(b"forward 5\ndown x\n") is None
+    assert _parse_single_digits(b"F5\nD3\n") is None
 
 
 def test_part_1():
@@ -85,6 +367,58 @@ def test_part_2():
     assert answer == 900
 
 
+def test_combine():
+    x, y = parse_input("day02/input.txt")
+    whole = summarise((x, y))
+    for split in (0, 1, 500, len(x)):
+        halves = summarise((x[:split], y[:split])), summarise((x[split:], y[split:]))
+        assert combine(*halves) == whole
+    a, b, c = [summarise((x[i : i + 300], y[i : i + 300])) for i in range(0, 900, 300)]
+    assert combine(combine(a, b), c) == combine(a, combine(b, c))
+
+
+def test_tracker():
+    tracker = Tracker()
+    tracker.command("forward 5")
+    tracker.command(b"down 5")
+    snapshot = tracker.snapshot()
+    tracker.commands("forward 8\nup 3\ndown 8\n")
+    tracker.command((2, 0))
+    assert (tracker.horizontal, tracker.depth, tracker.aim) == (15, 60, 10)
+    assert tracker.part_1() == 150
+    assert tracker.part_2() == 900
+
+    tracker.rewind(snapshot)
+    try:
+        tracker.command("backward 3")
+    except ValueError as error:
+        assert "backward 3" in str(error)
+    else:
+        raise AssertionError("applied a command with an unknown direction")
+    try:
+        tracker.commands("forward 12\nleft 2\n")
+    except ValueError as error:
+        assert "left" in str(error)
+    else:
+        raise AssertionError("applied commands with an unknown direction")
+    assert tracker.snapshot() == snapshot
+    assert (tracker.horizontal, tracker.depth, tracker.aim) == (5, 0, 5)
+    commands = parse_input("day02/input.txt")
+    tracker = Tracker()
+    tracker.commands(commands)
+    assert (tracker.part_1(), tracker.part_2()) == (part_1(commands), part_2(commands))
+
+
+def test_parallel_part_2(monkeypatch):
+    expected = part_2(parse_input("day02/input.txt"))
+    assert parallel_part_2("day02/input.txt", jobs=2, parts=5) == expected
+    monkeypatch.setattr(f"{__name__}.BLOCK_BYTES", 64)
+    size = os.path.getsize("day02/input.txt")
+    assert _summarise_range("day02/input.txt", 0, size) == summarise(
+        parse_input("day02/input.txt")
+    )
+
+
 if __name__ == "__main__":
     output = parse_input("day02/input.txt")
     answer_1 = part_1(output)
@@ -1,132 +1,230 @@
-def transpose(array: list) -> list:
-    """Transpose a list of strings.
+import random
+from bisect import bisect_left
+from itertools import repeat
+from operator import and_, rshift
+
+from utils.reader import mapped
+
+# Columns up to this width are counted with _spread_counts, wider ones with
+# _sliced_counts, which handles each row in one go whatever its width.
+SPREAD_WIDTH = 64
+
+
+def parse_input(input_file: str) -> tuple:
+    """Parse the txt puzzle input.
 
     Args:
-        array (list): List of strings.
+        input_file (str): Puzzle imput txt file.
 
     Returns:
-        list: Transposed input.
+        tuple: The binary numbers as ints, and their width in bits.
     """
-    return ["".join(i) for i in zip(*array)]
+    with mapped(input_file) as mm:
+        lines = mm[:].split()
+    width = len(lines[0]) if lines else 0
+    return list(map(int, lines, repeat(2))), width
 
 
-def parse_input(input_file: str) -> list:
-    """Parse the txt puzzle input.
+def _spread_counts(numbers: list, width: int) -> list:
+    """Count the ones in each bit column, 8 columns per pass.
+
+    Each byte of a number is looked up in a table that spreads its bits
+    into fields wide enough to hold any count, so summing the looked up
+    values adds up all 8 columns at once, in C.
 
     Args:
-        input_file (str): Puzzle imput txt file.
+        numbers (list): Binary numbers as ints.
+        width (int): Width of the numbers in bits.
 
     Returns:
-        list: Parsed puzzle input.
+        list: Number of ones in each column, from the least significant bit.
     """
-    o = open(input_file)
-    output = [i.strip() for i in o.readlines()]
-    return output
+    field = len(numbers).bit_length()
+    mask = (1 << field) - 1
+    spread = [
+        sum((byte >> k & 1) << (k * field) for k in range(8)) for byte in range(256)
+    ]
+    counts = []
+    for shift in range(0, width, 8):
+        shifted = map(rshift, numbers, repeat(shift)) if shift else numbers
+        total = sum(map(spread.__getitem__, map(and_, shifted, repeat(0xFF))))
+        counts.extend(total >> (k * field) & mask for k in range(min(8, width - shift)))
+    return counts
+
+
+def _sliced_counts(numbers: list, width: int) -> list:
+    """Count the ones in each bit column, in a single pass over the numbers.
+
+    The counts are kept bit sliced: bit k of planes[j] is bit j of the
+    count of column k. Adding a number is a ripple carry through the planes,
+    which updates every column at once with a few big int operations.
+
+    Args:
+        numbers (list): Binary numbers as ints.
+        width (int): Width of the numbers in bits.
+
+    Returns:
+        list: Number of ones in each column, from the least significant bit.
+    """
+    planes = []
+    for carry in numbers:
+        for j, plane in enumerate(planes):
+            planes[j] = plane ^ carry
+            carry &= plane
+            if not carry:
+                break
+        else:
+            if carry:
+                planes.append(carry)
+    return [
+        sum((plane >> k & 1) << j for j, plane in enumerate(planes))
+        for k in range(width)
+    ]
 
 
-def part_1(binary_numbers: list) -> int:
+def column_counts(numbers: list, width: int) -> list:
+    """Count the ones in each bit column. Any width works.
+
+    Args:
+        numbers (list): Binary numbers as ints.
+        width (int): Width of the numbers in bits.
+
+    Returns:
+        list: Number of ones in each column, from the most significant bit.
+    """
+    count = _spread_counts if width <= SPREAD_WIDTH else _sliced_counts
+    return count(numbers, width)[::-1]
+
+
+def part_1(report: tuple) -> int:
     """Solve part 1.
 
     Args:
-        binary_numbers (list): List of binary numbers.
+        report (tuple): Binary numbers and their width. Puzzle input.
 
     Returns:
         int: Gamma multiplied by epsilon.
     """
-    t_binary_numbers = transpose(binary_numbers)
-    threshold = len(t_binary_numbers[0]) / 2
-    gamma = ""
-    epsilon = ""
-    for i in t_binary_numbers:
-        count = i.count("1")
-        if count > threshold:
-            gamma += "1"
-            epsilon += "0"
-        else:
-            gamma += "0"
-            epsilon += "1"
-    gamma = int(gamma, 2)
-    epsilon = int(epsilon, 2)
+    numbers, width = report
+    gamma = 0
+    for ones in column_counts(numbers, width):
+        gamma = gamma << 1 | (2 * ones > len(numbers))
+    epsilon = gamma ^ ((1 << width) - 1)
     return gamma * epsilon
 
 
-def common_bit(binary_numbers: list, position: int, default_bit: str = "1") -> tuple:
+def common_bit(
+    binary_numbers: list, position: int, width: int, default_bit: int = 1
+) -> tuple:
     """Return the most common bit in that position in a list of binary numbers.
 
     Args:
-        binary_numbers (list): List of binary numbers.
-        position (int): Position to check.
-        default_bit (str, optional): The bit to return if 1 is the most common.
-        Defaults to "1".
+        binary_numbers (list): List of binary numbers as ints.
+        position (int): Position to check, from the most significant bit.
+        width (int): Width of the numbers in bits.
+        default_bit (int, optional): The bit to return if 1 is the most common.
+        Defaults to 1.
 
     Returns:
         tuple: The most common bit and its opposite.
     """
-    bits = [i[position] for i in binary_numbers]
-    threshold = len(binary_numbers) / 2
-    opposite_bit = str(1 - int(default_bit))
-    if bits.count("1") >= threshold:
+    shift = width - 1 - position
+    ones = sum(number >> shift & 1 for number in binary_numbers)
+    opposite_bit = 1 - default_bit
+    if 2 * ones >= len(binary_numbers):
         return default_bit, opposite_bit
     else:
         return opposite_bit, default_bit
 
 
-def part_1b(binary_numbers: list) -> int:
+def part_1b(report: tuple) -> int:
     """Solve part 1. Uses the common_bit function.
 
     Args:
-        binary_numbers (list): List of binary numbers.
+        report (tuple): Binary numbers and their width. Puzzle input.
 
     Returns:
         int: Gamma multiplied by epsilon.
     """
-    gamma = ""
-    epsilon = ""
-
-    bin_len = len(binary_numbers[0])
-    for n in range(bin_len):
-        gamma_bit, epsilon_bit = common_bit(binary_numbers, n)
-        gamma += gamma_bit
-        epsilon += epsilon_bit
-
-    gamma = int(gamma, 2)
-    epsilon = int(epsilon, 2)
+    binary_numbers, width = report
+    gamma = 0
+    epsilon = 0
+    for n in range(width):
+        gamma_bit, epsilon_bit = common_bit(binary_numbers, n, width)
+        gamma = gamma << 1 | gamma_bit
+        epsilon = epsilon << 1 | epsilon_bit
     return gamma * epsilon
 
 
-def bit_criteria_rating(binary_numbers: list, default_bit: str) -> int:
+class SortedReport:
+    def __init__(self, report: tuple) -> None:
+        """Diagnostic report sorted once for fast bit criteria ratings.
+
+        Numbers sharing a prefix are next to each other once sorted, and
+        within them the ones with a 0 in the next bit come first. So each
+        step of a rating narrows a range of the list with one bisect,
+        making a rating O(width * log n).
+
+        Args:
+            report (tuple): Binary numbers as ints and their width.
+        """
+        numbers, self.width = report
+        self.numbers = sorted(numbers)
+
+    def rating(self, default_bit: int) -> int:
+        """Returns the bit criteria rating.
+
+        Args:
+            default_bit (int): 1 for oxygen generator rating,
+            0 for CO2 scrubber rating.
+
+        Returns:
+            int: Criteria rating, or None if no number meets the criteria.
+        """
+        numbers = self.numbers
+        lo, hi = 0, len(numbers)
+        prefix = 0
+        for shift in reversed(range(self.width)):
+            if hi - lo <= 1:
+                break
+            split = bisect_left(numbers, prefix | 1 << shift, lo, hi)
+            ones = hi - split
+            bit = default_bit if 2 * ones >= hi - lo else 1 - default_bit
+            if bit:
+                lo = split
+                prefix |= 1 << shift
+            else:
+                hi = split
+        return numbers[lo] if lo < hi else None
+
+
+def bit_criteria_rating(report: tuple, default_bit: int) -> int:
     """Returns the bit criteria rating.
     Either the oxygen generator or CO2 scrubber rating.
 
     Args:
-        binary_numbers (list): List of binary numbers.
-        default_bit (str): "1" for oxygen generator rating,
-        "0" for CO2 scrubber rating.
+        report (tuple): Binary numbers and their width.
+        default_bit (int): 1 for oxygen generator rating,
+        0 for CO2 scrubber rating.
 
     Returns:
         int: Criteria rating.
     """
-    bin_len = len(binary_numbers[0])
+    return SortedReport(report).rating(default_bit)
 
-    for n in range(bin_len):
-        bit, _ = common_bit(binary_numbers, n, default_bit)
-        binary_numbers = [bin_num for bin_num in binary_numbers if bin_num[n] == bit]
 
-        if len(binary_numbers) == 1:
-            return int(binary_numbers[0], 2)
-
-
-def part_2(binary_numbers: list) -> int:
+def part_2(report: tuple) -> int:
     """Solve part 2.
 
     Args:
-        binary_numbers (list): List of binary numbers.
+        report (tuple): Binary numbers and their width. Puzzle input.
 
     Returns:
         int: Oxygen rating multiplied by CO2 rating.
     """
-    o2_rating = bit_criteria_rating(binary_numbers, "1")
-    co2_rating = bit_criteria_rating(binary_numbers, "0")
+    sorted_report = SortedReport(report)
+    o2_rating = sorted_report.rating(1)
+    co2_rating = sorted_report.rating(0)
     return o2_rating * co2_rating
 
 
@@ -134,9 +232,22 @@ def part_2(binary_numbers: list) -> int:
 
 
 def test_parse_input():
-    output = parse_input("day03/example.txt")
-    assert type(output) is list
-    assert all(type(i) is str for i in output)
+    numbers, width = parse_input("day03/example.txt")
+    assert width == 5
+    assert numbers[:3] == [0b00100, 0b11110, 0b10110]
+
+
+def test_column_counts():
+    numbers, width = parse_input("day03/example.txt")
+    assert column_counts(numbers, width) == [7, 5, 8, 7, 5]
+    rng = random.Random(3)
+    for width in (5, 64, 65, 200):
+        numbers = [rng.getrandbits(width) for _ in range(300)]
+        expected = [sum(n >> k & 1 for n in numbers) for k in range(width)]
+        assert _spread_counts(numbers, width) == expected
+        assert _sliced_counts(numbers, width) == expected
+        assert column_counts(numbers, width) == expected[::-1]
+    assert part_1(([0b1] * 5 + [0b0] * 4, 70)) == 1 * (2 ** 70 - 2)
 
 
 def test_part_1():
@@ -147,16 +258,41 @@ def test_part_1():
 
 def test_o2_generator_rating():
     output = parse_input("day03/example.txt")
-    rating = bit_criteria_rating(output, "1")
+    rating = bit_criteria_rating(output, 1)
     assert rating == 23
 
 
 def test_co2_scrubber_rating():
     output = parse_input("day03/example.txt")
-    rating = bit_criteria_rating(output, "0")
+    rating = bit_criteria_rating(output, 0)
     assert rating == 10
 
 
+def test_part_1b():
+    output = parse_input("day03/example.txt")
+    assert part_1b(output) == 198
+
+
+def test_sorted_report():
+    def filtered_rating(numbers: list, width: int, default_bit: int) -> int:
+        for n in range(width):
+            bit, _ = common_bit(numbers, n, width, default_bit)
+            numbers = [
+                number for number in numbers if number >> (width - 1 - n) & 1 == bit
+            ]
+            if len(numbers) == 1:
+                return numbers[0]
+
+    rng = random.Random(5)
+    for width in (4, 12, 80):
+        numbers = list({rng.getrandbits(width) for _ in range(500)})
+        report = SortedReport((numbers, width))
+        for default_bit in (0, 1):
+            assert report.rating(default_bit) == filtered_rating(
+                numbers, width, default_bit
+            )
+
+
 def test_part_2():
     output = parse_input("day03/example.txt")
     answer = part_2(output)
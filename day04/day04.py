@@ -1,55 +1,170 @@
-class Board:
-    def __init__(self, bingo_card: list) -> None:
-        """Bingo board.
+from typing import Iterator
+
+from utils.budget import budget
+from utils.reader import read_blocks
 
-        Args:
-            bingo_card (list): Bingo card board.
-        """
-        self.lines = []
-        t_bingo_card = [i for i in (zip(*bingo_card))]
-        for row in bingo_card:
-            self.lines.append(set(row))
-        for col in t_bingo_card:
-            self.lines.append(set(col))
 
-        self.unmarked_numbers = set([i for row in bingo_card for i in row])
-        self.called_numbers = set()
+class Bingo:
+    def __init__(self, boards: list) -> None:
+        """Bingo game over many square boards of the same size.
 
-    def call_number(self, number: int) -> bool:
+        Cells are indexed by their number, and each row and column keeps a
+        count of its marked cells, so calling a number only touches the
+        cells holding it.
+
+        Args:
+            boards (list): Bingo card boards, as lists of rows.
+        """
+        self.size = len(boards[0]) if boards else 0
+        self.cells = {}
+        for b, board in enumerate(boards):
+            first = b * self.size * self.size
+            for i, number in enumerate(number for row in board for number in row):
+                self.cells.setdefault(number, []).append(first + i)
+        self.row_marks = bytearray(self.size * len(boards))
+        self.col_marks = bytearray(self.size * len(boards))
+        self.unmarked = [sum(map(sum, board)) for board in boards]
+        self.won = bytearray(len(boards))
+        self.playing = len(boards)
+
+    def call_number(self, number: int) -> list:
         """Call bingo number.
 
+        Cells of boards that have already won are skipped.
+
         Args:
             number (int): Number to call.
 
         Returns:
-            bool: if bingo due to called number.
+            list: Boards that got bingo on this number, in board order.
         """
-        if number in self.unmarked_numbers:
-            self.unmarked_numbers.remove(number)
-        self.called_numbers.add(number)
-        return self.bingo()
+        size = self.size
+        area = size * size
+        row_marks, col_marks = self.row_marks, self.col_marks
+        unmarked, won = self.unmarked, self.won
+        winners = []
+        for cell in self.cells.pop(number, ()):
+            board = cell // area
+            if won[board]:
+                continue
+            unmarked[board] -= number
+            # Rows are numbered across all boards by cell // size.
+            row = cell // size
+            col = board * size + cell % size
+            row_marks[row] += 1
+            col_marks[col] += 1
+            if row_marks[row] == size or col_marks[col] == size:
+                won[board] = 1
+                winners.append(board)
+        self.playing -= len(winners)
+        return sorted(winners)
+
+    def calculate_score(self, board: int, called_number: int) -> int:
+        """Calculate the score of a board at time of bingo.
 
-    def bingo(self) -> bool:
-        """Determine if bingo has occurred.
+        Args:
+            board (int): Index of the board.
+            called_number (int): The number called on.
 
         Returns:
-            bool: Bingo occurrence.
+            int: The score.
         """
-        for line in self.lines:
-            if line < self.called_numbers:
-                return True
-        return False
+        return self.unmarked[board] * called_number
 
-    def calculate_score(self, called_number: int) -> int:
-        """Calculate the score of the board at time of bingo.
+    def play(self, numbers: list) -> Iterator[tuple]:
+        """Call numbers until every board has won.
 
         Args:
-            called_number (int): The number called on.
+            numbers (list): The numbers to be called.
 
-        Returns:
-            int: The score.
+        Yields:
+            tuple: Each winning board and its score, in the order they win.
         """
-        return sum(self.unmarked_numbers) * called_number
+        for number in numbers:
+            for board in self.call_number(number):
+                yield board, self.calculate_score(board, number)
+            if not self.playing:
+                return
+
+
+def call_ranks(numbers: list) -> dict:
+    """Rank each number by when it is called.
+
+    Args:
+        numbers (list): The numbers to be called.
+
+    Returns:
+        dict: Turn each number is first called on, counting from 0.
+    """
+    ranks = {}
+    for turn, number in enumerate(numbers):
+        ranks.setdefault(number, turn)
+    return ranks
+
+
+def win_turn(board: list, numbers: list, ranks: dict) -> tuple:
+    """Work out when a board wins without playing the game.
+
+    A line is complete on the turn its last number is called, the largest
+    rank on it, and the board wins on its earliest complete line.
+
+    Args:
+        board (list): Bingo card board, as a list of rows.
+        numbers (list): The numbers to be called.
+        ranks (dict): Call ranks of the numbers, from call_ranks.
+
+    Returns:
+        tuple: Turn the board wins on and its score, or None if it never
+        wins.
+    """
+    never = len(numbers)
+    rows = [[ranks.get(number, never) for number in row] for row in board]
+    turn = min(min(map(max, rows)), min(map(max, zip(*rows))))
+    if turn == never:
+        return None
+    unmarked = sum(
+        number
+        for row, row_ranks in zip(board, rows)
+        for number, rank in zip(row, row_ranks)
+        if rank > turn
+    )
+    return turn, unmarked * numbers[turn]
+
+
+def win_order(numbers: list, boards: list) -> list:
+    """Order the boards by when they win, in one pass over their cells.
+
+    Args:
+        numbers (list): The numbers to be called.
+        boards (list): The boards to play.
+
+    Returns:
+        list: Turn, board and score of each board that wins, ordered by
+        turn then board, as Bingo.play yields them.
+    """
+    ranks = call_ranks(numbers)
+    order = []
+    for b, board in enumerate(boards):
+        win = win_turn(board, numbers, ranks)
+        if win is not None:
+            order.append((win[0], b, win[1]))
+    order.sort()
+    return order
+
+
+def read_boards(input_file: str) -> tuple:
+    """Read the called numbers, and stream the boards one at a time.
+
+    Args:
+        input_file (str): Puzzle imput txt file.
+
+    Returns:
+        tuple: The numbers to be called, and an iterator of the boards.
+    """
+    blocks = read_blocks(input_file)
+    numbers = [int(num) for num in next(blocks)[0].split(",")]
+    boards = ([[int(num) for num in row.split()] for row in block] for block in blocks)
+    return numbers, boards
 
 
 def parse_input(input_file: str) -> tuple:
@@ -61,25 +176,37 @@ def parse_input(input_file: str) -> tuple:
     Returns:
         tuple: The numbers to be called and the boards to play.
     """
-    o = open(input_file)
-    numbers = o.readline().strip().split(",")
-    numbers = [int(num) for num in numbers]
-
-    o.readline()
-    board = []
-    boards = []
-    for i in o.readlines():
-        if i == "\n":
-            boards.append(board)
-            board = []
-        else:
-            row = i.strip().split(" ")
-            row = [int(num) for num in row if num != ""]
-            board.append(row)
-
-    # Append the last board
-    boards.append(board)
-    return numbers, boards
+    numbers, boards = read_boards(input_file)
+    return numbers, list(boards)
+
+
+def stream_winners(input_file: str) -> tuple:
+    """Find the first and last winning boards without loading every board.
+
+    Boards are read one at a time and scored against the ranked call list,
+    keeping only the earliest and latest win so far, so memory doesn't grow
+    with the number of boards.
+
+    Args:
+        input_file (str): Puzzle imput txt file.
+
+    Returns:
+        tuple: Turn, board and score of the first and of the last winning
+        board, as the ends of win_order, or None if no board wins.
+    """
+    numbers, boards = read_boards(input_file)
+    ranks = call_ranks(numbers)
+    first = last = None
+    for b, board in enumerate(boards):
+        win = win_turn(board, numbers, ranks)
+        if win is None:
+            continue
+        win = win[0], b, win[1]
+        if first is None or win < first:
+            first = win
+        if last is None or win > last:
+            last = win
+    return (first, last) if first else None
 
 
 def part_1(numbers: list, boards: list) -> int:
@@ -90,13 +217,10 @@ def part_1(numbers: list, boards: list) -> int:
         boards (list): The boards to play.
 
     Returns:
-        int: The score of the first winning board.
+        int: The score of the first winning board, or None if no board wins.
     """
-    boards = [Board(board) for board in boards]
-    for number in numbers:
-        for board in boards:
-            if board.call_number(number):
-                return board.calculate_score(number)
+    order = win_order(numbers, boards)
+    return order[0][2] if order else None
 
 
 def part_2(numbers: list, boards: list) -> int:
@@ -107,15 +231,10 @@ def part_2(numbers: list, boards: list) -> int:
         boards (list): The boards to play.
 
     Returns:
-        int: The score of the last winning board.
+        int: The score of the last winning board, or None if no board wins.
     """
-    boards = [Board(board) for board in boards]
-    for number in numbers:
-        if len(boards) > 1:
-            boards = [board for board in boards if not board.call_number(number)]
-        else:
-            if boards[0].call_number(number):
-                return boards[0].calculate_score(number)
+    order = win_order(numbers, boards)
+    return order[-1][2] if order else None
 
 
 # Tests
@@ -130,6 +249,30 @@ def test_parse_input():
         assert all(len(i) == 5 for i in board)
 
 
+def test_bingo():
+    numbers, boards = parse_input("day04/example.txt")
+    bingo = Bingo(boards)
+    assert bingo.call_number(7) == []
+    assert bingo.row_marks[:5] == bytes([0, 0, 1, 0, 0])
+    assert bingo.col_marks[:5] == bytes([0, 0, 0, 0, 1])
+    assert bingo.unmarked[0] == sum(map(sum, boards[0])) - 7
+    assert list(bingo.play(numbers[1:])) == [(2, 4512), (0, 2192), (1, 1924)]
+
+
+def test_win_order():
+    numbers, boards = parse_input("day04/example.txt")
+    assert win_turn(boards[2], numbers, call_ranks(numbers)) == (11, 4512)
+    assert win_turn(boards[2], numbers[:11], call_ranks(numbers[:11])) is None
+    assert win_order(numbers, boards) == [(11, 2, 4512), (13, 0, 2192), (14, 1, 1924)]
+    assert win_order(numbers[:4], boards) == []
+    assert part_1(numbers[:4], boards) is None
+    assert part_2(numbers[:4], boards) is None
+
+    numbers, boards = parse_input("day04/input.txt")
+    played = list(Bingo(boards).play(numbers))
+    assert [(b, score) for _, b, score in win_order(numbers, boards)] == played
+
+
 def test_part_1():
     numbers, boards = parse_input("day04/example.txt")
     answer = part_1(numbers, boards)
@@ -142,6 +285,18 @@ def test_part_2():
     assert answer == 1924
 
 
+def test_stream_winners():
+    assert stream_winners("day04/example.txt") == ((11, 2, 4512), (14, 1, 1924))
+    order = win_order(*parse_input("day04/input.txt"))
+    assert stream_winners("day04/input.txt") == (order[0], order[-1])
+
+
+@budget(seconds=3, mb=10, size=10_000)
+def test_stream_winners_budget(large_input):
+    first, last = stream_winners(large_input)
+    assert first <= last
+
+
 if __name__ == "__main__":
     numbers, boards = parse_input("day04/input.txt")
     answer_1 = part_1(numbers, boards)
@@ -1,4 +1,7 @@
-from collections import defaultdict
+from collections import Counter
+
+from utils.budget import budget
+from utils.reader import read_lines
 
 
 def parse_input(input_file: str) -> list:
@@ -11,8 +14,7 @@ def parse_input(input_file: str) -> list:
         list: Parsed puzzle input.
     """
     output = []
-    for line in open(input_file).readlines():
-        line = line.strip()
+    for line in read_lines(input_file):
         line = line.split(" -> ")
         line = [i.split(",") for i in line]
         line = [(int(i[0]), int(i[1])) for i in line]
@@ -46,11 +48,22 @@ def perfect_diagonal(xy1: tuple, xy2: tuple) -> bool:
     Returns:
         bool: if points are 45° to each other, return True.
     """
-    m = (xy2[1] - xy1[1]) / (xy2[0] - xy1[0])
-    if abs(m) == 1:
-        return True
-    else:
-        return False
+    return abs(xy2[0] - xy1[0]) == abs(xy2[1] - xy1[1])
+
+
+def steps(xy1: tuple, xy2: tuple) -> tuple:
+    """Integer step from one end of a line to the other.
+
+    Args:
+        xy1 (tuple): Coordinate 1.
+        xy2 (tuple): Coordinate 2.
+
+    Returns:
+        tuple: x step, y step, each -1, 0 or 1, and the number of steps.
+    """
+    dx = (xy2[0] > xy1[0]) - (xy2[0] < xy1[0])
+    dy = (xy2[1] > xy1[1]) - (xy2[1] < xy1[1])
+    return dx, dy, max(abs(xy2[0] - xy1[0]), abs(xy2[1] - xy1[1]))
 
 
 def interpolate(xy1: tuple, xy2: tuple) -> set:
@@ -63,30 +76,65 @@ def interpolate(xy1: tuple, xy2: tuple) -> set:
     Returns:
         set: The coordinates between the two points.
     """
-    covered_points = {xy1, xy2}
-    x_min = min(xy1[0], xy2[0])
-    x_max = max(xy1[0], xy2[0])
-    y_min = min(xy1[1], xy2[1])
-    y_max = max(xy1[1], xy2[1])
-    if xy1[0] - xy2[0] == 0:  # Vertical line
-
-        for y in range(y_min + 1, y_max):
-            covered_points.add((x_max, y))
-    else:
-        m = (xy2[1] - xy1[1]) / (xy2[0] - xy1[0])
-        c = xy1[1] - m * xy1[0]
-        fy = lambda x: m * x + c
+    dx, dy, n = steps(xy1, xy2)
+    return {(xy1[0] + i * dx, xy1[1] + i * dy) for i in range(n + 1)}
+
+
+def bounds(lines: list) -> tuple:
+    """Size of the grid the lines fit in.
 
-        for x in range(x_min + 1, x_max):
-            covered_points.add((x, fy(x)))
+    Args:
+        lines (list): List of lines.
+
+    Returns:
+        tuple: Width, height and the smallest x, y coordinate.
+    """
+    if not lines:
+        return 0, 0, (0, 0)
+    xs = [xy[0] for line in lines for xy in line]
+    ys = [xy[1] for line in lines for xy in line]
+    return max(xs) - min(xs) + 1, max(ys) - min(ys) + 1, (min(xs), min(ys))
 
-    return covered_points
+
+# Adds a line to the cells of a vent grid, saturating at 2 as only whether
+# a point is covered more than once matters.
+SATURATE = bytes(min(count + 1, 2) for count in range(256))
 
 
 class VentGrid:
-    def __init__(self) -> None:
-        """Vent grid."""
-        self.grid = defaultdict(int)
+    def __init__(self, width: int, height: int, origin: tuple = (0, 0)) -> None:
+        """Vent grid.
+
+        Counts are kept in a row major bytearray, so each line is a slice of
+        it, with a step of 1, width, or width ± 1 for 45° lines.
+
+        Args:
+            width (int): Width of the grid.
+            height (int): Height of the grid.
+            origin (tuple, optional): Coordinate of the first cell. Defaults
+            to (0, 0).
+        """
+        self.width = width
+        self.height = height
+        self.origin = origin
+        self.grid = bytearray(width * height)
+
+    def cell(self, xy: tuple) -> int:
+        """Index of a coordinate in the grid.
+
+        Args:
+            xy (tuple): Coordinate.
+
+        Raises:
+            ValueError: If the coordinate is outside of the grid.
+
+        Returns:
+            int: Index into grid.
+        """
+        x, y = xy[0] - self.origin[0], xy[1] - self.origin[1]
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError(f"{xy} is outside of the grid")
+        return y * self.width + x
 
     def add_points(self, points: set) -> None:
         """Add points to grid.
@@ -95,7 +143,8 @@ class VentGrid:
             points (set): The points to increment.
         """
         for point in points:
-            self.grid[point] += 1
+            cell = self.cell(point)
+            self.grid[cell] = SATURATE[self.grid[cell]]
 
     def add_line(self, xy1: tuple, xy2: tuple) -> None:
         """Add line to grid.
@@ -103,16 +152,25 @@ class VentGrid:
         Args:
             xy1 (tuple): Coordinate 1.
             xy2 (tuple): Coordinate 2.
-        """
-        points = interpolate(xy1, xy2)
-        self.add_points(points)
 
-    def total_overlapping(self):
-        count = 0
-        for v in self.grid.values():
-            if v > 1:
-                count += 1
-        return count
+        Raises:
+            ValueError: If the line isn't horizontal, vertical or 45°, or
+            goes outside of the grid.
+        """
+        dx, dy, n = steps(xy1, xy2)
+        if dx and dy and not perfect_diagonal(xy1, xy2):
+            raise ValueError(f"{xy1} -> {xy2} is not a straight line")
+        self.cell(xy2)
+        start = self.cell(xy1)
+        step = dy * self.width + dx
+        if step < 0:
+            start, step = start + n * step, -step
+        cells = slice(start, start + n * step + 1, step or 1)
+        self.grid[cells] = self.grid[cells].translate(SATURATE)
+
+    def total_overlapping(self) -> int:
+        grid = self.grid
+        return len(grid) - grid.count(0) - grid.count(1)
 
 
 def part_1(lines: list) -> int:
@@ -124,7 +182,7 @@ def part_1(lines: list) -> int:
     Returns:
         int: Number of overlapping lines in vent grid.
     """
-    grid = VentGrid()
+    grid = VentGrid(*bounds(lines))
     for line in lines:
         if non_diagonal(line[0], line[1]):
             grid.add_line(line[0], line[1])
@@ -140,7 +198,7 @@ def part_2(lines: list) -> int:
     Returns:
         int: Number of overlapping lines in vent grid.
     """
-    grid = VentGrid()
+    grid = VentGrid(*bounds(lines))
     for line in lines:
         if non_diagonal(line[0], line[1]) or perfect_diagonal(line[0], line[1]):
             grid.add_line(line[0], line[1])
@@ -182,12 +240,48 @@ def test_interpolate_diag():
     assert diag_2 == {(9, 7), (8, 8), (7, 9)}
 
 
+def test_vent_grid():
+    grid = VentGrid(4, 3)
+    grid.add_line((3, 0), (1, 2))
+    grid.add_line((1, 1), (3, 1))
+    grid.add_line((2, 2), (2, 2))
+    grid.add_points({(2, 2), (0, 0)})
+    assert grid.grid == bytes([1, 0, 0, 1, 0, 1, 2, 1, 0, 1, 2, 0])
+    grid.add_line((2, 0), (2, 2))
+    assert grid.total_overlapping() == 2
+    try:
+        grid.add_line((0, 0), (2, 1))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("added a line that isn't straight")
+
+    lines = [[(-2, 0), (2, 0)], [(0, -2), (0, 2)], [(1, 0), (1, 1)]]
+    assert bounds(lines) == (5, 5, (-2, -2))
+    assert part_2(lines) == 2
+    try:
+        grid.add_line((3, 2), (3, 3))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("added a line outside of the grid")
+
+    lines = parse_input("day05/input.txt")
+    covered = Counter(point for xy1, xy2 in lines for point in interpolate(xy1, xy2))
+    assert part_2(lines) == sum(count > 1 for count in covered.values())
+
+
 def test_part_2():
     output = parse_input("day05/example.txt")
     answer = part_2(output)
     assert answer == 12
 
 
+@budget(seconds=3, mb=20, size=30_000)
+def test_part_2_budget(large_input):
+    assert part_2(parse_input(large_input)) > 0
+
+
 if __name__ == "__main__":
     output = parse_input("day05/input.txt")
     answer_1 = part_1(output)
@@ -1,3 +1,6 @@
+from utils.reader import read_csv_ints
+
+
 def parse_input(input_file: str) -> list:
     """Parse puzzle input.
 
@@ -7,10 +10,7 @@ def parse_input(input_file: str) -> list:
     Returns:
         list: Initial lantern fish.
     """
-    o = open(input_file)
-    output = o.readline().strip().split(",")
-    output = [int(i) for i in output]
-    return output
+    return list(read_csv_ints(input_file))
 
 
 def stimulate_fish(fish: list, days: int) -> int:
@@ -1,3 +1,6 @@
+from utils.reader import read_lines
+
+
 def parse_input(input_file: str) -> list:
     """Parse puzzle input.
 
@@ -8,8 +11,7 @@ def parse_input(input_file: str) -> list:
         list: Puzzle input.
     """
     output = []
-    for line in open(input_file).readlines():
-        line = line.strip()
+    for line in read_lines(input_file):
         line = line.split(" | ")
         line = [i.split() for i in line]
         output.append(line)
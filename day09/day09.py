@@ -1,13 +1,16 @@
+from utils.grid import Grid
+
+
 class Cave:
-    def __init__(self, height_map: list) -> None:
+    def __init__(self, height_map: Grid) -> None:
         """Cave with height map.
 
         Args:
-            height_map (list): Height map of cave.
+            height_map (Grid): Height map of cave.
         """
         self.height_map = height_map
-        self.len_x = len(self.height_map[0])
-        self.len_y = len(self.height_map)
+        self.len_x = height_map.width
+        self.len_y = height_map.height
         self.max_x = self.len_x - 1
         self.max_y = self.len_y - 1
 
@@ -21,7 +24,7 @@ class Cave:
         Returns:
             int: Height of x, y.
         """
-        return self.height_map[y][x]
+        return self.height_map[x, y]
 
     def get_neighbours(self, x: int, y: int) -> list:
         """Get the neighbours of the given position.
@@ -33,16 +36,17 @@ class Cave:
         Returns:
             list: Neighbours of x, y.
         """
-        neighbours = []
-        if x != 0:
-            neighbours.append((x - 1, y))
-        if x < self.max_x:
-            neighbours.append((x + 1, y))
-        if y != 0:
-            neighbours.append((x, y - 1))
-        if y < self.max_y:
-            neighbours.append((x, y + 1))
-        return neighbours
+        i = self.height_map.index(x, y)
+        return [self.height_map.xy(n) for n in self.height_map.neighbours(i)]
+
+    def _is_low_point(self, i: int) -> bool:
+        """Determine if the cell at flat index i is a low point."""
+        heights = self.height_map.cells
+        height = heights[i]
+        for delta in self.height_map.deltas(i):
+            if heights[i + delta] <= height:
+                return False
+        return True
 
     def is_low_point(self, x: int, y: int) -> bool:
         """Determine if position is a low point.
@@ -54,12 +58,15 @@ class Cave:
         Returns:
             bool: True if position is a low point.
         """
-        neighbours = self.get_neighbours(x, y)
-        n_heights = [self.height(x_n, y_n) for x_n, y_n in neighbours]
-        if all(h > self.height(x, y) for h in n_heights):
-            return True
-        else:
-            return False
+        return self._is_low_point(self.height_map.index(x, y))
+
+    def low_points(self) -> list:
+        """Flat indexes of all low points.
+
+        Returns:
+            list: Low points.
+        """
+        return [i for i in range(len(self.height_map)) if self._is_low_point(i)]
 
     def calculate_risk_level(self) -> int:
         """Calculate risk level.
@@ -67,12 +74,24 @@ class Cave:
         Returns:
             int: Risk level.
         """
-        score = 0
-        for y in range(self.len_y):
-            for x in range(self.len_x):
-                if self.is_low_point(x, y):
-                    score += 1 + self.height(x, y)
-        return score
+        heights = self.height_map.cells
+        return sum(1 + heights[i] for i in self.low_points())
+
+    def _basin_size(self, i: int) -> int:
+        """Basin size of the low point at flat index i."""
+        heights = self.height_map.cells
+        stack = [i]
+        visited = {i}
+        while stack:
+            i = stack.pop()
+            height_i = heights[i]
+            for delta in self.height_map.deltas(i):
+                n = i + delta
+                height_n = heights[n]
+                if height_i < height_n < 9 and n not in visited:
+                    stack.append(n)
+                    visited.add(n)
+        return len(visited)
 
     def basin_size(self, x: int, y: int) -> int:
         """Determine the basin size of the position.
@@ -84,19 +103,7 @@ class Cave:
         Returns:
             int: Basin size.
         """
-        stack = [(x, y)]
-        visited = set([(x, y)])
-        while stack:
-            x_i, y_i = stack.pop()
-            height_i = self.height(x_i, y_i)
-            neighbours = self.get_neighbours(x_i, y_i)
-            for n in neighbours:
-                x_n, y_n = n
-                height_n = self.height(x_n, y_n)
-                if height_n > height_i and height_n < 9 and (x_n, y_n) not in visited:
-                    stack.append((x_n, y_n))
-                    visited.add((x_n, y_n))
-        return len(visited)
+        return self._basin_size(self.height_map.index(x, y))
 
     def part_2(self) -> int:
         """Solve part 2.
@@ -104,31 +111,21 @@ class Cave:
         Returns:
             int: Top 3 basin sizes multiplied together.
         """
-        basins = []
-        for y in range(self.len_y):
-            for x in range(self.len_x):
-                if self.is_low_point(x, y):
-                    basins.append(self.basin_size(x, y))
+        basins = [self._basin_size(i) for i in self.low_points()]
         basins.sort()
         return basins[-3] * basins[-2] * basins[-1]
 
 
-def parse_input(input_file: str) -> list:
+def parse_input(input_file: str) -> Grid:
     """Parse the txt puzzle input.
 
     Args:
         input_file (str): Puzzle imput txt file.
 
     Returns:
-        list: Parsed puzzle input.
+        Grid: Height map.
     """
-    o = open(input_file)
-    output = [i.strip() for i in o.readlines()]
-    grid = []
-    for i in output:
-        row = [int(num) for num in i]
-        grid.append(row)
-    return grid
+    return Grid.from_file(input_file)
 
 
 # Tests
@@ -136,10 +133,10 @@ def parse_input(input_file: str) -> list:
 
 def test_parse_input():
     output = parse_input("day09/example.txt")
-    assert type(output) is list
-    assert all(type(i) is list for i in output)
-    for i in output:
-        assert all(type(num) is int for num in i)
+    assert type(output) is Grid
+    assert (output.width, output.height) == (10, 5)
+    assert output[0, 0] == 2
+    assert output[9, 4] == 8
 
 
 def test_is_low_point():
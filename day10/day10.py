@@ -1,3 +1,6 @@
+from utils.reader import read_lines
+
+
 def parse_input(input_file: str) -> list:
     """Parse the txt puzzle input.
 
@@ -7,9 +10,7 @@ def parse_input(input_file: str) -> list:
     Returns:
         list: Parsed puzzle input.
     """
-    o = open(input_file)
-    output = [i.strip() for i in o.readlines()]
-    return output
+    return list(read_lines(input_file))
 
 
 def opposite_bracket(
@@ -1,19 +1,23 @@
+from utils.grid import Grid
+
+
+# Raises every light level by one in a single bytes.translate call.
+INCREMENT = bytes(range(1, 256)) + b"\xff"
+
+
 class Octopi:
-    def __init__(self, lights: list) -> None:
+    def __init__(self, lights: Grid) -> None:
         """Map of octopi and their lights.
 
         Args:
-            lights (list): Light levels of octopi.
+            lights (Grid): Light levels of octopi. Copied, so the same
+            input can be used again.
         """
-        self.lights = lights
-        self.len_x = len(lights[0])
-        self.len_y = len(lights)
+        self.lights = lights.copy()
+        self.len_x = lights.width
+        self.len_y = lights.height
         self.max_x = self.len_x - 1
         self.max_y = self.len_y - 1
-        self.coords = set()
-        for y in range(self.len_y):
-            for x in range(self.len_x):
-                self.coords.add((x, y))
         self.flash_count = 0
 
     def level(self, x: int, y: int) -> int:
@@ -26,7 +30,7 @@ class Octopi:
         Returns:
             int: Level of octopi.
         """
-        return self.lights[y][x]
+        return self.lights[x, y]
 
     def reset_level(self, x: int, y: int, value: int = 0) -> int:
         """Reset the level of the octopi at that position.
@@ -35,29 +39,12 @@ class Octopi:
             x (int): x position.
             y (int): y position.
             value (int, optional): Level to set octopi to. Defaults to 0.
-
-        Returns:
-            int: [description]
         """
-        self.lights[y][x] = value
-
-    def increment(self, x: int, y: int, for_zero: bool = True):
-        """Increment the octopi at that position.
-
-        Args:
-            x (int): x position.
-            y (int): y position.
-            for_zero (bool, optional): If False, don't increment if octopi
-            is at light level 0. Defaults to True.
-        """
-        if for_zero or self.level(x, y) != 0:
-            self.lights[y][x] += 1
+        self.lights[x, y] = value
 
     def increment_all(self):
         """Increment all octopi."""
-        for y in range(self.len_y):
-            for x in range(self.len_x):
-                self.increment(x, y)
+        self.lights.cells = self.lights.cells.translate(INCREMENT)
 
     def get_neighbours(self, x: int, y: int) -> list:
         """Get all neighbours of the octopi at that position.
@@ -69,41 +56,37 @@ class Octopi:
         Returns:
             list: Neighbouring octopi.
         """
-        potential_neighbours = [
-            (x, y + 1),
-            (x + 1, y + 1),
-            (x + 1, y),
-            (x + 1, y - 1),
-            (x, y - 1),
-            (x - 1, y - 1),
-            (x - 1, y),
-            (x - 1, y + 1),
-        ]
-        neighbours = [n for n in potential_neighbours if n in self.coords]
-        return neighbours
-
-    def flash(self, x: int, y: int):
-        """Flash the octopi at that position.
+        i = self.lights.index(x, y)
+        return [self.lights.xy(n) for n in self.lights.neighbours(i, diagonal=True)]
+
+    def flash(self, i: int):
+        """Flash the octopi at flat index i, and any octopi it sets off.
 
         Args:
-            x (int): x position.
-            y (int): y position.
+            i (int): Flat index of the octopi.
         """
-        self.flash_count += 1
-        self.reset_level(x, y)
-        for n in self.get_neighbours(x, y):
-            x_n, y_n = n
-            self.increment(x_n, y_n, for_zero=False)
-            if 0 < self.level(x_n, y_n) >= 10:
-                self.flash(x_n, y_n)
+        levels = self.lights.cells
+        stack = [i]
+        levels[i] = 0
+        while stack:
+            i = stack.pop()
+            self.flash_count += 1
+            for delta in self.lights.deltas(i, diagonal=True):
+                n = i + delta
+                if levels[n] != 0:
+                    levels[n] += 1
+                    if levels[n] >= 10:
+                        levels[n] = 0
+                        stack.append(n)
 
     def advance(self):
         """Advance one step."""
         self.increment_all()
-        for y in range(self.len_y):
-            for x in range(self.len_x):
-                if self.level(x, y) >= 10:
-                    self.flash(x, y)
+        levels = self.lights.cells
+        i = levels.find(10)
+        while i != -1:
+            self.flash(i)
+            i = levels.find(10, i + 1)
 
     def part_1(self, steps: int = 100) -> int:
         """Solve part 1.
@@ -124,7 +107,7 @@ class Octopi:
         Returns:
             bool: True if all octopi have just flashed.
         """
-        return all(light == 0 for row in self.lights for light in row)
+        return not any(self.lights.cells)
 
     def part_2(self) -> int:
         """Solve part 2.
@@ -139,22 +122,16 @@ class Octopi:
         return step
 
 
-def parse_input(input_file: str):
+def parse_input(input_file: str) -> Grid:
     """Parse the txt puzzle input.
 
     Args:
         input_file (str): Puzzle imput txt file.
 
     Returns:
-        list: Parsed puzzle input.
+        Grid: Light levels of octopi.
     """
-    o = open(input_file)
-    output = [i.strip() for i in o.readlines()]
-    grid = []
-    for i in output:
-        row = [int(num) for num in i]
-        grid.append(row)
-    return grid
+    return Grid.from_file(input_file)
 
 
 # Tests
@@ -168,10 +145,9 @@ def test_get_neighbours():
 
 def test_parse_input():
     output = parse_input("day11/example.txt")
-    assert type(output) is list
-    assert all(type(i) is list for i in output)
-    for i in output:
-        assert all(type(num) is int for num in i)
+    assert type(output) is Grid
+    assert (output.width, output.height) == (10, 10)
+    assert output[0, 0] == 5
 
 
 def test_part_1():
@@ -1,5 +1,8 @@
 from collections import deque, defaultdict, Counter
 
+from utils.budget import budget
+from utils.reader import read_lines
+
 
 class Graph:
     def __init__(self) -> None:
@@ -89,8 +92,7 @@ def parse_input(input_file: str) -> list:
     Returns:
         list: Parsed puzzle input.
     """
-    o = open(input_file)
-    output = [i.strip().split("-") for i in o.readlines()]
+    output = [line.split("-") for line in read_lines(input_file)]
     return output
 
 
@@ -153,6 +155,11 @@ def test_part_2():
     assert part_2(output3) == 3509
 
 
+@budget(seconds=1, size=11)
+def test_part_2_budget(large_input):
+    assert part_2(parse_input(large_input)) > 0
+
+
 if __name__ == "__main__":
     output = parse_input("day12/input.txt")
     answer_1 = part_1(output)
@@ -1,5 +1,7 @@
 from collections import defaultdict
 
+from utils.reader import read_blocks
+
 
 class FoldingPaper:
     def __init__(self, dots: list) -> None:
@@ -57,10 +59,9 @@ def parse_input(input_file: str) -> tuple:
     Returns:
         tuple: Parsed puzzle input. Initial dots and the folds to make.
     """
-    o = open(input_file)
-    output = [i.strip().split(",") for i in o.readlines()]
-    dots = [(int(i[0]), int(i[1])) for i in output if len(i) == 2]
-    instructions = [i[0].split("=") for i in output if "fold" in i[0]]
+    dot_lines, fold_lines = read_blocks(input_file)
+    dots = [tuple(int(i) for i in line.split(",")) for line in dot_lines]
+    instructions = [line.split("=") for line in fold_lines]
     instructions = [(i[0][-1], int(i[1])) for i in instructions]
     return dots, instructions
 
@@ -1,5 +1,7 @@
 from collections import Counter
 
+from utils.reader import read_blocks
+
 
 def parse_input(input_file: str) -> tuple[str, dict]:
     """Parse puzzle input.
@@ -10,10 +12,8 @@ def parse_input(input_file: str) -> tuple[str, dict]:
     Returns:
         tuple[str, dict]: Polymer and the rules.
     """
-    o = open(input_file)
-    polymer = o.readline().strip()
-    o.readline()
-    rules = [i.strip().split(" -> ") for i in o.readlines()]
+    (polymer,), rule_lines = read_blocks(input_file)
+    rules = [line.split(" -> ") for line in rule_lines]
     rules = {(i[0][0], i[0][1]): i[1] for i in rules}
     return polymer, rules
 
@@ -1,19 +1,23 @@
 import heapq
+from array import array
+
+from utils.budget import budget
+from utils.grid import Grid
 
 
 class Cavern:
     """Cavern.
 
     Args:
-        grid (list): Grid of cavern.
+        grid (Grid): Risk level of each position in the cavern.
     """
 
-    def __init__(self, grid: list) -> None:
-        self.len_x = len(grid[0])
-        self.len_y = len(grid)
+    def __init__(self, grid: Grid) -> None:
+        self.len_x = grid.width
+        self.len_y = grid.height
         self.max_x = self.len_x - 1
         self.max_y = self.len_y - 1
-        self.grid = grid_list_to_dict(grid)
+        self.grid = grid
 
     def risk(self, xy: tuple) -> int:
         return self.grid[xy]
@@ -27,17 +31,8 @@ class Cavern:
         Returns:
             list: Neighbours of x, y.
         """
-        x, y = xy
-        neighbours = []
-        if x != 0:
-            neighbours.append((x - 1, y))
-        if x < self.max_x:
-            neighbours.append((x + 1, y))
-        if y != 0:
-            neighbours.append((x, y - 1))
-        if y < self.max_y:
-            neighbours.append((x, y + 1))
-        return neighbours
+        i = self.grid.index(*xy)
+        return [self.grid.xy(n) for n in self.grid.neighbours(i)]
 
     def minimum_path(self, xy: tuple) -> int:
         """Djikstras.
@@ -48,23 +43,27 @@ class Cavern:
         Returns:
             int: Accumulated risk.
         """
-        cost = dict.fromkeys(self.grid.keys(), float("infinity"))
-        cost[(0, 0)] = 0
-        pq = [(0, (0, 0))]
-        visited = set()
+        risks = self.grid.cells
+        target = self.grid.index(*xy)
+        cost = array("L", [0xFFFFFFFF]) * len(risks)
+        cost[0] = 0
+        pq = [(0, 0)]
+        visited = bytearray(len(risks))
         while pq:
             current_risk, node = heapq.heappop(pq)
 
-            if node == xy:
+            if node == target:
                 return current_risk
 
-            if node in visited:
+            if visited[node]:
                 continue
-            visited.add(node)
+            visited[node] = 1
 
-            neighbours = [n for n in self.get_neighbours(node) if n not in visited]
-            for n in neighbours:
-                new_risk = current_risk + self.risk(n)
+            for delta in self.grid.deltas(node):
+                n = node + delta
+                if visited[n]:
+                    continue
+                new_risk = current_risk + risks[n]
                 if new_risk < cost[n]:
                     cost[n] = new_risk
                     heapq.heappush(pq, (new_risk, n))
@@ -75,18 +74,22 @@ class Cavern:
         Args:
             n (int): Factor to enlarge cavern by.
         """
-        coords = list(self.grid.keys())
-        for x, y in coords:
-            for x_diff, x_i in enumerate(range(x, x + self.len_x * n, self.len_x)):
-                for y_diff, y_i in enumerate(range(y, y + self.len_y * n, self.len_y)):
-                    diff = x_diff + y_diff
-                    self.grid[(x_i, y_i)] = self.grid[(x, y)] + diff
-                    if self.grid[(x_i, y_i)] > 9:
-                        self.grid[(x_i, y_i)] = self.grid[(x_i, y_i)] % 9
+        # Tables raising each risk level by diff, wrapping 9 back round to 1.
+        raise_by = [
+            bytes((v - 1 + diff) % 9 + 1 if v else 0 for v in range(256))
+            for diff in range(2 * n - 1)
+        ]
+        rows = list(self.grid.rows())
+        enlarged = bytearray()
+        for y_diff in range(n):
+            for row in rows:
+                for x_diff in range(n):
+                    enlarged += row.translate(raise_by[x_diff + y_diff])
         self.len_x = self.len_x * n
         self.len_y = self.len_y * n
         self.max_x = self.len_x - 1
         self.max_y = self.len_y - 1
+        self.grid = Grid(self.len_x, self.len_y, enlarged)
 
     def minimum_path_recursion(self, x: int, y: int) -> int:
         """A recursive solution I tried to part 1.
@@ -108,38 +111,16 @@ class Cavern:
             ) + self.risk((x, y))
 
 
-def parse_input(input_file: str) -> list:
+def parse_input(input_file: str) -> Grid:
     """Parse the txt puzzle input.
 
     Args:
         input_file (str): Puzzle imput txt file.
 
     Returns:
-        list: Parsed puzzle input.
-    """
-    o = open(input_file)
-    output = [i.strip() for i in o.readlines()]
-    grid = []
-    for i in output:
-        row = [int(num) for num in i]
-        grid.append(row)
-    return grid
-
-
-def grid_list_to_dict(grid: list) -> dict:
-    """Convert grid made of lists to a dict.
-
-    Args:
-        grid (list): Grid to convert.
-
-    Returns:
-        dict: Dict representation of grid.
+        Grid: Risk level of each position.
     """
-    grid_dict = {}
-    for y, row in enumerate(grid):
-        for x, risk in enumerate(row):
-            grid_dict[(x, y)] = risk
-    return grid_dict
+    return Grid.from_file(input_file)
 
 
 def part_1():
@@ -155,17 +136,9 @@ def part_2():
 
 def test_parse_input():
     output = parse_input("day15/example1.txt")
-    assert type(output) is list
-    assert all(type(i) is list for i in output)
-    for i in output:
-        assert all(type(num) is int for num in i)
-
-
-def test_grid_dict():
-    output = parse_input("day15/example1.txt")
-    grid = grid_list_to_dict(output)
-    assert type(grid) is dict
-    assert grid[(8, 9)] == 8
+    assert type(output) is Grid
+    assert (output.width, output.height) == (10, 10)
+    assert output[8, 9] == 8
 
 
 def test_part_1():
@@ -182,7 +155,6 @@ def test_enlarge_grid():
     expected_output = parse_input("day15/example2.txt")
     expected_cavern = Cavern(expected_output)
     assert len(cavern.grid) == len(expected_cavern.grid)
-    assert cavern.grid.keys() == expected_cavern.grid.keys()
     assert cavern.grid == expected_cavern.grid
     assert cavern.len_x == expected_cavern.len_x
     assert cavern.len_y == expected_cavern.len_y
@@ -194,6 +166,13 @@ def test_part_2():
     ...
 
 
+@budget(seconds=2, size=60)
+def test_part_2_budget(large_input):
+    cavern = Cavern(parse_input(large_input))
+    cavern.enlarge_cavern(5)
+    assert cavern.minimum_path((cavern.max_x, cavern.max_y)) > 0
+
+
 if __name__ == "__main__":
     output = parse_input("day15/input.txt")
     cavern = Cavern(output)
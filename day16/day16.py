@@ -1,4 +1,4 @@
-from ast import parse
+from utils.reader import read_lines
 
 
 def parse_input(input_file: str) -> str:
@@ -10,8 +10,7 @@ def parse_input(input_file: str) -> str:
     Returns:
         str: hexadecimal representation.
     """
-    o = open(input_file)
-    return o.read()
+    return "".join(read_lines(input_file))
 
 
 def hex_to_bin(hex_rep: str) -> str:
@@ -1,5 +1,22 @@
+import re
 from collections import defaultdict
 
+from utils.reader import read_lines
+
+
+def parse_input(input_file: str) -> tuple:
+    """Parse puzzle input.
+
+    Args:
+        input_file (str): Puzzle input txt file.
+
+    Returns:
+        tuple: Target area bounds (x_min, x_max, y_min, y_max).
+    """
+    target = "".join(read_lines(input_file))
+    x_min, x_max, y_min, y_max = map(int, re.findall(r"-?\d+", target))
+    return x_min, x_max, y_min, y_max
+
 
 def triangular_number(n: int) -> int:
     """Calculate the nth triangle number.
@@ -105,6 +122,10 @@ def part_2(x_min: int, x_max: int, y_min: int, y_max: int) -> int:
 # Tests
 
 
+def test_parse_input():
+    assert parse_input("day17/example.txt") == (20, 30, -10, -5)
+
+
 def test_part_1():
     assert part_1(-10) == 45
 
@@ -157,8 +178,9 @@ def test_part_2():
 
 
 if __name__ == "__main__":
-    answer_1 = part_1(-126)
-    answer_2 = part_2(217, 240, -126, -69)
+    x_min, x_max, y_min, y_max = parse_input("day17/input.txt")
+    answer_1 = part_1(y_min)
+    answer_2 = part_2(x_min, x_max, y_min, y_max)
 
     print("Day 17 Solutions:")
     print(f"Part 1: {answer_1}")
@@ -1,10 +1,12 @@
 import ast
 from itertools import permutations
 
+from utils.reader import read_lines
+
 
 def parse_input(input_file: str):
     output = []
-    for line in open(input_file).readlines():
+    for line in read_lines(input_file):
         output.append(ast.literal_eval(line))
     return output
 
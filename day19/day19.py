@@ -1,6 +1,8 @@
 from collections import defaultdict, Counter
 from itertools import combinations, product
 
+from utils.reader import read_blocks
+
 
 def parse_input(input_file: str) -> list:
     """Parse puzzle input.
@@ -11,18 +13,10 @@ def parse_input(input_file: str) -> list:
     Returns:
         list: Liat of scanner objects.
     """
-    o = open(input_file)
     scanners = []
-    for line in o.readlines():
-        if line.startswith("---"):
-            beacons = []
-        elif line == "\n":
-            scanners.append(beacons)
-        else:
-            beacons.append(tuple([int(i) for i in line.strip().split(",")]))
-
-    # Append last set of beacons
-    scanners.append(beacons)
+    for _, *lines in read_blocks(input_file):
+        beacons = [tuple([int(i) for i in line.split(",")]) for line in lines]
+        scanners.append(beacons)
 
     # Convert to Scanner objects
     scanner_objs = []
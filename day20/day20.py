@@ -1,29 +1,24 @@
-from collections import defaultdict
+from utils.grid import Grid
+from utils.reader import read_blocks
 
 pixel_map = {"#": 1, ".": 0}
 
+# Maps "#" and "." to the pixel values 1 and 0.
+PIXELS = bytes.maketrans(b"#.", b"\x01\x00")
+
 
 class Enhancement:
-    def __init__(self, algorithm: str, image_list: list):
+    def __init__(self, algorithm: str, image: Grid):
         """Trench map.
 
         Args:
             algorithm (str): Image enhancement algorithm.
-            image_list (list): Input image.
+            image (Grid): Input image.
         """
-        self.algorithm = algorithm
-
-        self.min_x = 0
-        self.min_y = 0
-        self.max_x = len(image_list[0])
-        self.max_y = len(image_list)
-
-        self.input_image = {}
-        for y in range(len(image_list)):
-            for x in range(len(image_list[0])):
-                self.input_image[x, y] = pixel_map[image_list[y][x]]
-
-        self.increase_margins()
+        self.algorithm = bytes(pixel_map[i] for i in algorithm)
+        self.input_image = image
+        # Value of every pixel in the infinite image outside input_image.
+        self.background = 0
 
     @property
     def lit_pixels(self) -> int:
@@ -32,65 +27,48 @@ class Enhancement:
         Returns:
             int: Lit pixels.
         """
-        return sum(self.input_image.values())
-
-    def increase_margins(self, margin=2):
-        """Increase margins.
-
-        Args:
-            margin (int, optional): Value to increase margin by. Defaults to 2.
-        """
-        self.min_x -= margin
-        self.min_y -= margin
-        self.max_x += margin
-        self.max_y += margin
+        return sum(self.input_image.cells)
 
     def step(self, steps: int):
         """Perform a step.
 
-        Args:
-            steps (int): Number of steps to take.
-        """
-        for i in range(steps):
-            to_update = {}
-            for y in range(self.min_y, self.max_y + 1):
-                for x in range(self.min_x, self.max_x + 1):
-                    output_pixel = self.calc_pixel(x, y, i)
-                    # Update at the end
-                    to_update[x, y] = output_pixel
-
-            for x, y in to_update:
-                self.input_image[x, y] = to_update[x, y]
-            self.increase_margins()
-
-    def calc_pixel(self, x: int, y: int, step: int) -> int:
-        """Determine pixel value.
+        Each step grows the image by one pixel on every side, which is as
+        far as the enhancement can reach into the background.
 
         Args:
-            x (int): x position.
-            y (int): y position.
-            step (int): Current step.
-
-        Returns:
-            int: Pixel value.
+            steps (int): Number of steps to take.
         """
-        bin_num = ""
-        for dx, dy in [
-            (-1, -1),
-            (0, -1),
-            (1, -1),
-            (-1, 0),
-            (0, 0),
-            (1, 0),
-            (-1, 1),
-            (0, 1),
-            (1, 1),
-        ]:
-            infinite_pixel = step % (pixel_map[self.algorithm[0]] + 1)
-            pixel = self.input_image.get((x + dx, y + dy), infinite_pixel)
-            bin_num += str(pixel)
-        output_pixel = pixel_map[self.algorithm[int(bin_num, 2)]]
-        return output_pixel
+        for _ in range(steps):
+            image = self.input_image
+            width = image.width + 2
+            height = image.height + 2
+
+            # Pad with two rows and columns of background on every side, so
+            # every output pixel has a full 3x3 window.
+            pad = bytes([self.background])
+            padded_width = width + 2
+            blank_row = pad * padded_width
+            padded = [blank_row, blank_row]
+            for row in image.rows():
+                padded.append(pad * 2 + bytes(row) + pad * 2)
+            padded += [blank_row, blank_row]
+
+            output = bytearray()
+            for y in range(height):
+                top, middle, bottom = padded[y], padded[y + 1], padded[y + 2]
+                index = 0
+                for x in range(padded_width):
+                    index = (
+                        ((index << 1) & 0b110110110)
+                        | top[x] << 6
+                        | middle[x] << 3
+                        | bottom[x]
+                    )
+                    if x >= 2:
+                        output.append(self.algorithm[index])
+
+            self.input_image = Grid(width, height, output)
+            self.background = self.algorithm[0b111111111 if self.background else 0]
 
 
 def parse_input(input_file: str) -> Enhancement:
@@ -102,32 +80,26 @@ def parse_input(input_file: str) -> Enhancement:
     Returns:
         Enhancement: Trench map puzzle output.
     """
-    o = open(input_file)
-    o = o.read()
-    algorithm, image_str = o.split("\n\n")
-    image_list = image_str.split("\n")
+    algorithm_lines, image_list = read_blocks(input_file)
+    algorithm = "".join(algorithm_lines)
+    image = Grid.from_rows((row.encode() for row in image_list), table=PIXELS)
 
-    enhance = Enhancement(algorithm, image_list)
+    enhance = Enhancement(algorithm, image)
     return enhance
 
 
-def print_grid(grid: dict) -> str:
-    """Print coordinates inside a 2D matrix.
+def print_grid(grid: Grid) -> str:
+    """Print a grid of pixels.
     Used for debugging.
 
     Args:
-        grid (dict): Coordinates.
+        grid (Grid): Pixels.
 
     Returns:
         str: Printable string representation of matrix.
     """
-    max_x = max(x for x, _ in grid) + 1
-    max_y = max(y for _, y in grid) + 1
-    matrix = [["." for _ in range(max_x)] for _ in range(max_y)]
-    for x, y in grid:
-        if grid[x, y]:
-            matrix[y][x] = "#"
-    printable_matrix = "\n".join(["".join(i) for i in matrix])
+    matrix = ["".join("#" if pixel else "." for pixel in row) for row in grid.rows()]
+    printable_matrix = "\n".join(matrix)
     return "\n" + printable_matrix
 
 
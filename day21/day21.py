@@ -1,6 +1,21 @@
 import functools
 from itertools import product
 
+from utils.reader import read_lines
+
+
+def parse_input(input_file: str) -> tuple:
+    """Parse puzzle input.
+
+    Args:
+        input_file (str): Puzzle input txt file.
+
+    Returns:
+        tuple: Starting positions of player 1 and player 2.
+    """
+    positions = [int(line.split(": ")[1]) for line in read_lines(input_file)]
+    return tuple(positions)
+
 
 def determined_dice():
     """Generator for the determined dice.
@@ -115,6 +130,10 @@ def part_2(position1: int, position2: int, score1: int = 0, score2: int = 0) ->
 # Tests
 
 
+def test_parse_input():
+    assert parse_input("day21/example.txt") == (4, 8)
+
+
 def test_part_1():
     answer = part_1(4, 8)
     assert answer == 739785
@@ -126,8 +145,9 @@ def test_part_2():
 
 
 if __name__ == "__main__":
-    answer_1 = part_1(8, 3)
-    answer_2 = max(part_2(8, 3))
+    position1, position2 = parse_input("day21/input.txt")
+    answer_1 = part_1(position1, position2)
+    answer_2 = max(part_2(position1, position2))
 
     print("Day 21 Solutions:")
     print(f"Part 1: {answer_1}")
@@ -2,6 +2,8 @@ from collections import defaultdict
 from itertools import product
 import re
 
+from utils.reader import read_lines
+
 
 def parse_input(input_file: str) -> list:
     """Parse puzzle input.
@@ -12,14 +14,13 @@ def parse_input(input_file: str) -> list:
     Returns:
         list: Commands.
     """
-    o = open(input_file)
     commands = []
-    for line in o.readlines():
+    for line in read_lines(input_file):
         if line[:2] == "on":
             signal = 1
         else:
             signal = 0
-        x1, x2, y1, y2, z1, z2 = map(int, re.findall("-?\d+", line))
+        x1, x2, y1, y2, z1, z2 = map(int, re.findall(r"-?\d+", line))
         commands.append((signal, [x1, x2, y1, y2, z1, z2]))
     return commands
 
@@ -1,17 +1,24 @@
+from utils.grid import Grid
+
+
+EAST, SOUTH, EMPTY = b">v."
+
+
 class Cucumbers:
-    def __init__(self, grid: dict, regions: dict, max_x: int, max_y: int) -> None:
+    def __init__(self, grid: Grid) -> None:
         """Sea cucumbers.
 
         Args:
-            grid (dict): Initial grid of sea cucumbers.
-            regions (dict): Number of cucumbers in each region.
-            max_x (int): Max x position.
-            max_y (int): Max y position.
+            grid (Grid): Initial sea floor, wrapping around at the edges.
         """
         self.grid = grid
-        self.regions = regions
-        self.max_x = max_x
-        self.max_y = max_y
+        self.max_x = grid.width - 1
+        self.max_y = grid.height - 1
+        cells = grid.cells
+        self.regions = {
+            EAST: [i for i in range(len(cells)) if cells[i] == EAST],
+            SOUTH: [i for i in range(len(cells)) if cells[i] == SOUTH],
+        }
 
     def get_neighbour(self, xy: tuple) -> tuple:
         """Get neighbour of cucumber.
@@ -23,17 +30,11 @@ class Cucumbers:
             tuple: Neighbour position.
         """
         region = self.grid[xy]
-        x, y = xy
-        if region == ">":
-            xi = x + 1
-            if xi > self.max_x:
-                xi = 0
-            return (xi, y)
-        elif region == "v":
-            yi = y + 1
-            if yi > self.max_y:
-                yi = 0
-            return (x, yi)
+        i = self.grid.index(*xy)
+        if region == EAST:
+            return self.grid.xy(self.grid.offset(i, 1, 0))
+        elif region == SOUTH:
+            return self.grid.xy(self.grid.offset(i, 0, 1))
         return None
 
     def step(self) -> bool:
@@ -42,21 +43,29 @@ class Cucumbers:
         Returns:
             bool: If the cucumbers have remained still or not.
         """
-        new_grid = self.grid.copy()
-        new_regions = {">": [], "v": [], ".": []}
+        cells = self.grid.cells
+        width = self.grid.width
+        size = len(cells)
         still = True
-        for herd in [">", "v"]:
-            for xy in self.regions[herd]:
-                neighbour = self.get_neighbour(xy)
-                if neighbour and self.grid[neighbour] == ".":
-                    new_regions[herd].append(neighbour)
-                    new_grid[neighbour] = self.grid[xy]
-                    new_grid[xy] = "."
-                    still = False
+        for herd in [EAST, SOUTH]:
+            positions = []
+            moves = []
+            for i in self.regions[herd]:
+                if herd == EAST:
+                    n = i + 1 if (i + 1) % width else i + 1 - width
                 else:
-                    new_regions[herd].append(xy)
-            self.grid.update(new_grid)
-        self.regions.update(new_regions)
+                    n = i + width if i + width < size else i + width - size
+                if cells[n] == EMPTY:
+                    moves.append((i, n))
+                    positions.append(n)
+                else:
+                    positions.append(i)
+            for i, n in moves:
+                cells[i] = EMPTY
+                cells[n] = herd
+            self.regions[herd] = positions
+            if moves:
+                still = False
         return still
 
     def step_until_still(self) -> int:
@@ -82,14 +91,8 @@ def parse_input(input_file: str) -> Cucumbers:
     Returns:
         Cucumbers: Cucumbers object.
     """
-    o = open(input_file)
-    grid = {}
-    regions = {">": [], "v": [], ".": []}
-    for y, line in enumerate(o.readlines()):
-        for x, region in enumerate(line.strip()):
-            grid[x, y] = region
-            regions[region].append((x, y))
-    cucs = Cucumbers(grid, regions, x, y)
+    grid = Grid.from_file(input_file, table=None, wrap=True)
+    cucs = Cucumbers(grid)
     return cucs
 
 
@@ -101,6 +104,13 @@ def test_parse_input():
     assert type(cucs) == Cucumbers
 
 
+def test_get_neighbour():
+    cucs = parse_input("day25/example.txt")
+    assert cucs.get_neighbour((0, 0)) == (0, 1)
+    assert cucs.get_neighbour((cucs.max_x, 0)) == (0, 0)
+    assert cucs.get_neighbour((1, 0)) is None
+
+
 def test_part_1():
     cucs = parse_input("day25/example.txt")
     assert cucs.step_until_still() == 58
@@ -0,0 +1,28 @@
+def budget(seconds: float = None, mb: float = None, size: int = None, seed: int = 0):
+    """Mark a test to run within a time and memory budget.
+
+    The test fails when it takes longer than seconds, or when the resident
+    memory of the process grows by more than mb while it runs. Memory the
+    interpreter frees and reuses doesn't grow the resident size, so mb only
+    catches allocations larger than what the process already holds. A test can
+    take the large_input fixture, a generated input of the given size for
+    the test's day, see conftest.py. This doesn't import pytest, so the days
+    can keep running without it.
+
+    Args:
+        seconds (float, optional): Wall time budget. Defaults to no limit.
+        mb (float, optional): Peak memory growth budget in MB. Defaults to
+        no limit.
+        size (int, optional): Size of large_input. Defaults to the largest
+        benchmark size of the day.
+        seed (int, optional): Seed of large_input. Defaults to 0.
+
+    Returns:
+        callable: Decorator for the test.
+    """
+
+    def mark(test):
+        test.budget = {"seconds": seconds, "mb": mb, "size": size, "seed": seed}
+        return test
+
+    return mark
@@ -1,15 +1,51 @@
+import random
+from typing import Iterator
+
+from utils.budget import budget
+from utils.reader import read_lines
+
+# Input sizes `python -m advent bench` times this day at, in the units of
+# generate_input.
+BENCHMARK = {"sizes": [1_000, 2_000, 4_000, 8_000]}
+
+
+def read_input(input_file: str) -> Iterator[str]:
+    """Stream the puzzle input one record at a time.
+
+    Args:
+        input_file (str): Puzzle input txt file.
+
+    Yields:
+        str: Line of the puzzle input.
+    """
+    yield from read_lines(input_file)
+
+
 def parse_input(input_file: str):
-    ...
+    return list(read_input(input_file))
 
 
-def part_1():
+def part_1(data):
     ...
 
 
-def part_2():
+def part_2(data):
     ...
 
 
+def generate_input(rng: random.Random, size: int) -> str:
+    """Generate a synthetic puzzle input for tests and benchmarks.
+
+    Args:
+        rng (random.Random): Random number generator.
+        size (int): Size of the input.
+
+    Returns:
+        str: Puzzle input.
+    """
+    raise NotImplementedError
+
+
 # Tests
 
 
@@ -25,5 +61,15 @@ def test_part_2():
     ...
 
 
+@budget(seconds=1, mb=50)
+def test_part_2_budget(large_input):
+    assert part_2(parse_input(large_input)) is not None
+
+
 if __name__ == "__main__":
-    pass
+    output = parse_input("$name/input.txt")
+    answer_1 = part_1(output)
+    answer_2 = part_2(output)
+    print("Day $day Solutions:")
+    print(f"Part 1: {answer_1}")
+    print(f"Part 2: {answer_2}")
@@ -0,0 +1,214 @@
+from array import array
+from typing import Iterable, Iterator
+
+from utils.reader import DIGITS, read_raw_lines
+
+NEIGHBOURS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+NEIGHBOURS_8 = NEIGHBOURS_4 + ((-1, -1), (1, -1), (-1, 1), (1, 1))
+
+
+class Grid:
+    def __init__(self, width: int, height: int, cells=None, wrap: bool = False) -> None:
+        """Rectangular grid stored row by row in a flat bytearray or array.
+
+        Cells are addressed either by (x, y) or by their flat index
+        y * width + x. Neighbour offsets are precomputed for each kind of
+        edge cell, so looking up neighbours allocates nothing.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+            cells (bytearray | array, optional): Cell values, row by row.
+            Defaults to a bytearray of zeros.
+            wrap (bool, optional): If True, the grid is toroidal and edges
+            wrap around. Defaults to False.
+        """
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height) if cells is None else cells
+        self.wrap = wrap
+        self._deltas = {
+            False: self._delta_table(NEIGHBOURS_4),
+            True: self._delta_table(NEIGHBOURS_8),
+        }
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable,
+        table: bytes = None,
+        wrap: bool = False,
+        typecode: str = None,
+    ):
+        """Build a grid from rows of equal length.
+
+        Args:
+            rows (Iterable): Rows as bytes, or sequences of ints.
+            table (bytes, optional): bytes.translate table applied to each
+            row, i.e. to turn b"#" into 1. Defaults to None.
+            wrap (bool, optional): If the grid wraps around. Defaults to False.
+            typecode (str, optional): array typecode for cells that don't fit
+            in a byte. Defaults to a bytearray.
+
+        Returns:
+            Grid: The grid.
+        """
+        cells = bytearray() if typecode is None else array(typecode)
+        width = height = 0
+        for row in rows:
+            if table is not None:
+                row = row.translate(table)
+            cells.extend(row)
+            width = len(row)
+            height += 1
+        return cls(width, height, cells, wrap)
+
+    @classmethod
+    def from_file(cls, input_file: str, table: bytes = DIGITS, wrap: bool = False):
+        """Load a grid of characters from a file, one row per line.
+
+        Args:
+            input_file (str): File to read.
+            table (bytes, optional): bytes.translate table for each row.
+            Defaults to digit characters to their values.
+            wrap (bool, optional): If the grid wraps around. Defaults to False.
+
+        Returns:
+            Grid: The grid.
+        """
+        rows = (line for line in read_raw_lines(input_file) if line)
+        return cls.from_rows(rows, table, wrap)
+
+    def _delta_table(self, offsets: tuple) -> list:
+        """Neighbour index deltas for each kind of cell.
+
+        Cells are grouped by which edges they touch, see _edges.
+
+        Args:
+            offsets (tuple): (dx, dy) offsets of the neighbours.
+
+        Returns:
+            list: Tuple of index deltas for each of the 16 edge groups.
+        """
+        if not self.cells:
+            return [()] * 16
+        table = []
+        for edges in range(16):
+            x = (
+                0
+                if edges & 1
+                else self.width - 1
+                if edges & 2
+                else min(1, self.width - 1)
+            )
+            y = (
+                0
+                if edges & 4
+                else self.height - 1
+                if edges & 8
+                else min(1, self.height - 1)
+            )
+            deltas = []
+            for dx, dy in offsets:
+                n = self.offset(self.index(x, y), dx, dy)
+                if n is not None:
+                    deltas.append(n - self.index(x, y))
+            table.append(tuple(deltas))
+        return table
+
+    def _edges(self, i: int) -> int:
+        y, x = divmod(i, self.width)
+        return (
+            (x == 0)
+            | (x == self.width - 1) << 1
+            | (y == 0) << 2
+            | (y == self.height - 1) << 3
+        )
+
+    def index(self, x: int, y: int) -> int:
+        """Flat index of (x, y)."""
+        return y * self.width + x
+
+    def xy(self, i: int) -> tuple:
+        """(x, y) of a flat index."""
+        y, x = divmod(i, self.width)
+        return x, y
+
+    def offset(self, i: int, dx: int, dy: int) -> int:
+        """Index of the cell dx, dy away from cell i.
+
+        Args:
+            i (int): Flat index.
+            dx (int): Columns to move.
+            dy (int): Rows to move.
+
+        Returns:
+            int: Flat index, or None if off a grid that doesn't wrap.
+        """
+        y, x = divmod(i, self.width)
+        x += dx
+        y += dy
+        if self.wrap:
+            x %= self.width
+            y %= self.height
+        elif not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return y * self.width + x
+
+    def deltas(self, i: int, diagonal: bool = False) -> tuple:
+        """Index deltas from cell i to each of its neighbours.
+
+        Args:
+            i (int): Flat index.
+            diagonal (bool, optional): Include diagonal neighbours.
+            Defaults to False.
+
+        Returns:
+            tuple: Precomputed deltas, so i + delta is a neighbour.
+        """
+        return self._deltas[diagonal][self._edges(i)]
+
+    def neighbours(self, i: int, diagonal: bool = False) -> Iterator[int]:
+        """Yield the flat indexes of the neighbours of cell i.
+
+        Args:
+            i (int): Flat index.
+            diagonal (bool, optional): Include diagonal neighbours.
+            Defaults to False.
+
+        Yields:
+            int: Flat index of a neighbour.
+        """
+        for delta in self._deltas[diagonal][self._edges(i)]:
+            yield i + delta
+
+    def rows(self) -> Iterator:
+        """Yield each row of cells."""
+        for y in range(0, len(self.cells), self.width):
+            yield self.cells[y : y + self.width]
+
+    def copy(self):
+        """Copy of the grid with its own cells."""
+        return Grid(self.width, self.height, self.cells[:], self.wrap)
+
+    def __getitem__(self, xy: tuple) -> int:
+        x, y = xy
+        return self.cells[y * self.width + x]
+
+    def __setitem__(self, xy: tuple, value: int) -> None:
+        x, y = xy
+        self.cells[y * self.width + x] = value
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Grid)
+            and (self.width, self.height, self.wrap)
+            == (other.width, other.height, other.wrap)
+            and self.cells == other.cells
+        )
+
+    def __repr__(self) -> str:
+        return f"Grid(width={self.width}, height={self.height}, wrap={self.wrap})"
@@ -1,23 +1,28 @@
 import os
-import shutil
+from string import Template
 
 
 def make_day(day: int):
-    """Make a folder that a days challenge.
+    """Make a folder for a days challenge.
+
+    The day's module is made from utils/day_template.py, so it starts out
+    with an input generator, a benchmark ladder and a budget test, which
+    python -m advent run, bench and profile all pick up.
 
     Args:
         day (int): Day to make. I.e. 25.
     """
-    day_name = f"day{day}"
+    day_name = f"day{day:02d}"
     if not os.path.exists(day_name):
         os.mkdir(f"{day_name}")
         open(f"{day_name}/input.txt", "a").close()
         open(f"{day_name}/example.txt", "a").close()
-        shutil.copy("utils/day_template.py", f"{day_name}")
-        os.rename(f"{day_name}/day_template.py", f"{day_name}/{day_name}.py")
+        with open("utils/day_template.py") as f:
+            template = Template(f.read())
+        with open(f"{day_name}/{day_name}.py", "w") as f:
+            f.write(template.substitute(day=day, name=day_name))
 
 
 if __name__ == "__main__":
     for i in range(1, 26):
-        i = "{0:02d}".format(i)
         make_day(i)
@@ -0,0 +1,174 @@
+import mmap
+from contextlib import contextmanager
+from typing import Iterator
+
+# Maps the ASCII digits "0".."9" to the byte values 0..9.
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+@contextmanager
+def mapped(input_file: str):
+    """Memory-map a file for reading. The file is closed on exit.
+
+    Args:
+        input_file (str): File to map.
+
+    Yields:
+        mmap.mmap | bytes: The mapped file, or b"" if the file is empty.
+    """
+    with open(input_file, "rb") as f:
+        if f.seek(0, 2) == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def line_ranges(input_file: str, parts: int) -> list:
+    """Split a file into byte ranges of about equal size on line breaks.
+
+    Args:
+        input_file (str): File to split.
+        parts (int): Number of ranges.
+
+    Returns:
+        list: (start, end) byte offsets of each non-empty range.
+    """
+    with mapped(input_file) as mm:
+        size = len(mm)
+        starts = [0]
+        for i in range(1, parts):
+            newline = mm.find(b"\n", max(size * i // parts, starts[-1]))
+            if newline == -1:
+                break
+            starts.append(newline + 1)
+    ends = starts[1:] + [size]
+    return [(start, end) for start, end in zip(starts, ends) if start < end]
+
+
+def read_line_blocks(
+    input_file: str, start: int = 0, end: int = None, block_bytes: int = 2 ** 23
+) -> Iterator[bytes]:
+    """Yield a byte range of a file in blocks of whole lines.
+
+    Args:
+        input_file (str): File to read.
+        start (int, optional): Offset of the first byte, at the start of a
+        line. Defaults to 0.
+        end (int, optional): Offset past the last byte, at the end of a
+        line. Defaults to the end of the file.
+        block_bytes (int, optional): Size a block is cut at, before moving
+        on to the end of its last line. Defaults to 8MB.
+
+    Yields:
+        bytes: Block of lines.
+    """
+    with mapped(input_file) as mm:
+        end = len(mm) if end is None else end
+        while start < end:
+            stop = min(start + block_bytes, end)
+            if stop < end:
+                stop = mm.find(b"\n", stop, end) + 1 or end
+            yield mm[start:stop]
+            start = stop
+
+
+def read_raw_lines(input_file: str) -> Iterator[bytes]:
+    """Yield each line of a file as bytes, with surrounding whitespace removed.
+
+    Args:
+        input_file (str): File to read.
+
+    Yields:
+        bytes: Line.
+    """
+    with mapped(input_file) as mm:
+        if not mm:
+            return
+        for line in iter(mm.readline, b""):
+            yield line.strip()
+
+
+def read_lines(input_file: str) -> Iterator[str]:
+    """Yield each line of a file, with surrounding whitespace removed.
+
+    Args:
+        input_file (str): File to read.
+
+    Yields:
+        str: Line.
+    """
+    for line in read_raw_lines(input_file):
+        yield line.decode()
+
+
+def read_ints(input_file: str) -> Iterator[int]:
+    """Yield the int on each line of a file.
+
+    Args:
+        input_file (str): File to read.
+
+    Yields:
+        int: Value of the line.
+    """
+    for line in read_raw_lines(input_file):
+        if line:
+            yield int(line)
+
+
+def read_csv_ints(input_file: str) -> Iterator[int]:
+    """Yield comma-separated ints, i.e. "3,4,3,1,2".
+
+    Args:
+        input_file (str): File to read.
+
+    Yields:
+        int: Value.
+    """
+    with mapped(input_file) as mm:
+        start = 0
+        end = len(mm)
+        while start < end:
+            comma = mm.find(b",", start)
+            if comma == -1:
+                comma = end
+            field = mm[start:comma].strip()
+            if field:
+                yield int(field)
+            start = comma + 1
+
+
+def read_digit_rows(input_file: str) -> Iterator[bytes]:
+    """Yield each row of a grid of digits, i.e. "2199943210".
+
+    Rows are bytes of the digit values, so row[0] == 2 for the row above.
+
+    Args:
+        input_file (str): File to read.
+
+    Yields:
+        bytes: Digit values of the row.
+    """
+    for line in read_raw_lines(input_file):
+        if line:
+            yield line.translate(DIGITS)
+
+
+def read_blocks(input_file: str) -> Iterator[list]:
+    """Yield blocks of lines separated by blank lines.
+
+    Args:
+        input_file (str): File to read.
+
+    Yields:
+        list: Lines of the block.
+    """
+    block = []
+    for line in read_lines(input_file):
+        if line:
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block